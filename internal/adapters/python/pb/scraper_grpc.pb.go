@@ -19,7 +19,8 @@ import (
 const _ = grpc.SupportPackageIsVersion9
 
 const (
-	ScraperService_ScrapeContent_FullMethodName = "/scraper.ScraperService/ScrapeContent"
+	ScraperService_ScrapeContent_FullMethodName       = "/scraper.ScraperService/ScrapeContent"
+	ScraperService_StreamScrapeContent_FullMethodName = "/scraper.ScraperService/StreamScrapeContent"
 )
 
 // ScraperServiceClient is the client API for ScraperService service.
@@ -30,6 +31,10 @@ const (
 type ScraperServiceClient interface {
 	// ScrapeContent extracts content (captions, transcript) from a URL
 	ScrapeContent(ctx context.Context, in *ScrapeRequest, opts ...grpc.CallOption) (*ScrapeResponse, error)
+	// StreamScrapeContent sends content as it becomes available: the first
+	// message carries captions, metadata and any error, and each following
+	// message carries the next piece of the transcript
+	StreamScrapeContent(ctx context.Context, in *ScrapeRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ScrapeResponse], error)
 }
 
 type scraperServiceClient struct {
@@ -50,6 +55,25 @@ func (c *scraperServiceClient) ScrapeContent(ctx context.Context, in *ScrapeRequ
 	return out, nil
 }
 
+func (c *scraperServiceClient) StreamScrapeContent(ctx context.Context, in *ScrapeRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ScrapeResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ScraperService_ServiceDesc.Streams[0], ScraperService_StreamScrapeContent_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[ScrapeRequest, ScrapeResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ScraperService_StreamScrapeContentClient = grpc.ServerStreamingClient[ScrapeResponse]
+
 // ScraperServiceServer is the server API for ScraperService service.
 // All implementations must embed UnimplementedScraperServiceServer
 // for forward compatibility.
@@ -58,6 +82,10 @@ func (c *scraperServiceClient) ScrapeContent(ctx context.Context, in *ScrapeRequ
 type ScraperServiceServer interface {
 	// ScrapeContent extracts content (captions, transcript) from a URL
 	ScrapeContent(context.Context, *ScrapeRequest) (*ScrapeResponse, error)
+	// StreamScrapeContent sends content as it becomes available: the first
+	// message carries captions, metadata and any error, and each following
+	// message carries the next piece of the transcript
+	StreamScrapeContent(*ScrapeRequest, grpc.ServerStreamingServer[ScrapeResponse]) error
 	mustEmbedUnimplementedScraperServiceServer()
 }
 
@@ -71,6 +99,9 @@ type UnimplementedScraperServiceServer struct{}
 func (UnimplementedScraperServiceServer) ScrapeContent(context.Context, *ScrapeRequest) (*ScrapeResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method ScrapeContent not implemented")
 }
+func (UnimplementedScraperServiceServer) StreamScrapeContent(*ScrapeRequest, grpc.ServerStreamingServer[ScrapeResponse]) error {
+	return status.Error(codes.Unimplemented, "method StreamScrapeContent not implemented")
+}
 func (UnimplementedScraperServiceServer) mustEmbedUnimplementedScraperServiceServer() {}
 func (UnimplementedScraperServiceServer) testEmbeddedByValue()                        {}
 
@@ -110,6 +141,17 @@ func _ScraperService_ScrapeContent_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ScraperService_StreamScrapeContent_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(ScrapeRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ScraperServiceServer).StreamScrapeContent(m, &grpc.GenericServerStream[ScrapeRequest, ScrapeResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ScraperService_StreamScrapeContentServer = grpc.ServerStreamingServer[ScrapeResponse]
+
 // ScraperService_ServiceDesc is the grpc.ServiceDesc for ScraperService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -122,6 +164,12 @@ var ScraperService_ServiceDesc = grpc.ServiceDesc{
 			Handler:    _ScraperService_ScrapeContent_Handler,
 		},
 	},
-	Streams:  []grpc.StreamDesc{},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "StreamScrapeContent",
+			Handler:       _ScraperService_StreamScrapeContent_Handler,
+			ServerStreams: true,
+		},
+	},
 	Metadata: "scraper.proto",
 }
@@ -307,9 +307,10 @@ const file_scraper_proto_rawDesc = "" +
 	"\x0fPLATFORM_TIKTOK\x10\x01\x12\x14\n" +
 	"\x10PLATFORM_YOUTUBE\x10\x02\x12\x16\n" +
 	"\x12PLATFORM_INSTAGRAM\x10\x03\x12\x10\n" +
-	"\fPLATFORM_WEB\x10\x042R\n" +
+	"\fPLATFORM_WEB\x10\x042\x9c\x01\n" +
 	"\x0eScraperService\x12@\n" +
-	"\rScrapeContent\x12\x16.scraper.ScrapeRequest\x1a\x17.scraper.ScrapeResponseB)Z'receipt-bot/internal/adapters/python/pbb\x06proto3"
+	"\rScrapeContent\x12\x16.scraper.ScrapeRequest\x1a\x17.scraper.ScrapeResponse\x12H\n" +
+	"\x13StreamScrapeContent\x12\x16.scraper.ScrapeRequest\x1a\x17.scraper.ScrapeResponse0\x01B)Z'receipt-bot/internal/adapters/python/pbb\x06proto3"
 
 var (
 	file_scraper_proto_rawDescOnce sync.Once
@@ -337,9 +338,11 @@ var file_scraper_proto_depIdxs = []int32{
 	4, // 1: scraper.ScrapeResponse.metadata:type_name -> scraper.ScrapeResponse.MetadataEntry
 	3, // 2: scraper.ScrapeResponse.error:type_name -> scraper.Error
 	1, // 3: scraper.ScraperService.ScrapeContent:input_type -> scraper.ScrapeRequest
-	2, // 4: scraper.ScraperService.ScrapeContent:output_type -> scraper.ScrapeResponse
-	4, // [4:5] is the sub-list for method output_type
-	3, // [3:4] is the sub-list for method input_type
+	1, // 4: scraper.ScraperService.StreamScrapeContent:input_type -> scraper.ScrapeRequest
+	2, // 5: scraper.ScraperService.ScrapeContent:output_type -> scraper.ScrapeResponse
+	2, // 6: scraper.ScraperService.StreamScrapeContent:output_type -> scraper.ScrapeResponse
+	5, // [5:7] is the sub-list for method output_type
+	3, // [3:5] is the sub-list for method input_type
 	3, // [3:3] is the sub-list for extension type_name
 	3, // [3:3] is the sub-list for extension extendee
 	0, // [0:3] is the sub-list for field type_name
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Run the gRPC server."""
 
-from src.grpc_server.server import serve
+from src.grpc_server.server import main
 
 if __name__ == '__main__':
-    serve()
+    main()
@@ -4,15 +4,20 @@ import asyncio
 import logging
 import os
 import sys
-from concurrent import futures
 from dotenv import load_dotenv
 
 import grpc
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
 # Import generated proto files (after running make generate)
 try:
     from src import scraper_pb2_grpc
     from src.grpc_server.servicers import ScraperServicer
+    from src.utils.http import close_session
 except ImportError as e:
     print("Error: Proto files not generated. Run 'make generate' first")
     print(f"Import error: {e}")
@@ -29,49 +34,72 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def serve():
+def _server_options():
+    """Build HTTP/2 transport options for the gRPC server from the environment."""
+    return [
+        ('grpc.max_concurrent_streams', int(os.getenv('GRPC_MAX_CONCURRENT_STREAMS', '512'))),
+        ('grpc.keepalive_time_ms', int(os.getenv('GRPC_KEEPALIVE_TIME_MS', '10000'))),
+        ('grpc.keepalive_timeout_ms', int(os.getenv('GRPC_KEEPALIVE_TIMEOUT_MS', '20000'))),
+        ('grpc.http2.max_pings_without_data', 0),
+        (
+            'grpc.http2.min_time_between_pings_ms',
+            int(os.getenv('GRPC_MIN_TIME_BETWEEN_PINGS_MS', '10000')),
+        ),
+        (
+            'grpc.http2.initial_connection_window_size',
+            int(os.getenv('GRPC_INITIAL_CONNECTION_WINDOW_SIZE', '1048576')),
+        ),
+        (
+            'grpc.http2.initial_stream_window_size',
+            int(os.getenv('GRPC_INITIAL_STREAM_WINDOW_SIZE', '524288')),
+        ),
+    ]
+
+
+async def serve():
     """Start the gRPC server."""
     port = os.getenv('GRPC_PORT', '50051')
-    max_workers = int(os.getenv('GRPC_MAX_WORKERS', '10'))
     temp_dir = os.getenv('TEMP_DIR', '/tmp/recipe-bot')
 
     # Create server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
-
-    # Add servicer
-    servicer = ScraperServicer(output_dir=temp_dir)
-
-    # Wrap async servicer methods
-    class SyncScraperServicer(scraper_pb2_grpc.ScraperServiceServicer):
-        def ScrapeContent(self, request, context):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(
-                    servicer.ScrapeContent(request, context)
-                )
-            finally:
-                loop.close()
+    server = grpc.aio.server(options=_server_options())
 
+    # Add servicer (async methods run natively on the server's event loop)
     scraper_pb2_grpc.add_ScraperServiceServicer_to_server(
-        SyncScraperServicer(),
+        ScraperServicer(output_dir=temp_dir),
         server
     )
 
     # Start server
     server.add_insecure_port(f'[::]:{port}')
-    server.start()
+    await server.start()
 
     logger.info(f"gRPC server started on port {port}")
     logger.info(f"Temporary directory: {temp_dir}")
     logger.info(f"Transcription provider: {os.getenv('TRANSCRIPTION_PROVIDER', 'google-stt')}")
 
     try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
+        await server.wait_for_termination()
+    finally:
         logger.info("Shutting down server...")
-        server.stop(grace=5)
+        try:
+            await server.stop(grace=5)
+        finally:
+            await close_session()
+
+
+def main():
+    """Run the gRPC server until interrupted."""
+    try:
+        if uvloop is not None:
+            # Run on libuv's event loop without changing the global loop policy
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(serve())
+        else:
+            asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == '__main__':
-    serve()
+    main()
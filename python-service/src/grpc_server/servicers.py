@@ -2,8 +2,11 @@
 
 import logging
 import asyncio
+from contextlib import aclosing
 from typing import Optional
 
+import grpc
+
 # Import generated proto files
 from src import scraper_pb2
 
@@ -12,6 +15,18 @@ from src.utils.url_parser import Platform
 
 logger = logging.getLogger(__name__)
 
+# Proto Platform values are contiguous from 0, so index directly
+_PROTO_TO_PLATFORM = (
+    Platform.PLATFORM_UNKNOWN,
+    Platform.PLATFORM_TIKTOK,
+    Platform.PLATFORM_YOUTUBE,
+    Platform.PLATFORM_INSTAGRAM,
+    Platform.PLATFORM_WEB,
+)
+
+# Transcript characters per StreamScrapeContent message
+_TRANSCRIPT_CHUNK_SIZE = 32 * 1024
+
 
 class ScraperServicer:
     """Implementation of ScraperService."""
@@ -53,33 +68,104 @@ class ScraperServicer:
             )
 
             # Build response
-            response = scraper_pb2.ScrapeResponse(
-                captions=result.captions,
-                transcript=result.transcript or "",
-                original_url=result.original_url,
-                metadata=result.metadata,
-            )
-
-            if result.error:
-                response.error.message = result.error
-                response.error.code = "SCRAPING_ERROR"
+            response = self._build_response(result)
+            response.transcript = result.transcript or ""
 
             logger.info(f"Successfully scraped {request.url}")
             return response
 
         except Exception as e:
             logger.error(f"Error in ScrapeContent: {e}", exc_info=True)
+            return self._error_response(request.url, e)
+
+    async def StreamScrapeContent(self, request, context):
+        """
+        Handle StreamScrapeContent RPC.
+
+        The first message carries captions, metadata and any error; each
+        following message carries the next piece of the transcript.
+
+        Args:
+            request: ScrapeRequest proto message
+            context: gRPC context
+
+        Yields:
+            ScrapeResponse proto messages
+        """
+        header_sent = False
+        try:
+            logger.info(f"Received streaming scrape request for URL: {request.url}")
+
+            platform = self._convert_platform(request.platform)
+            scraper = self.factory.get_scraper(request.url, platform)
+
+            # aclosing() removes the scraper's temp files as soon as the RPC ends
+            async with aclosing(
+                scraper.scrape_stream(url=request.url, transcribe=request.transcribe)
+            ) as items:
+                async for item in items:
+                    if not header_sent:
+                        header_sent = True
+                        yield self._build_response(item)
+                        continue
+
+                    for start in range(0, len(item), _TRANSCRIPT_CHUNK_SIZE):
+                        yield scraper_pb2.ScrapeResponse(
+                            transcript=item[start:start + _TRANSCRIPT_CHUNK_SIZE]
+                        )
 
-            return scraper_pb2.ScrapeResponse(
-                captions="",
-                transcript="",
-                original_url=request.url,
-                metadata={},
-                error=scraper_pb2.Error(
-                    message=str(e),
-                    code="INTERNAL_ERROR"
-                )
+            logger.info(f"Successfully streamed {request.url}")
+
+        except Exception as e:
+            logger.error(f"Error in StreamScrapeContent: {e}", exc_info=True)
+            if header_sent:
+                # Headers already went out; end the stream with a status instead
+                await context.abort(grpc.StatusCode.INTERNAL, str(e))
+            yield self._error_response(request.url, e)
+
+    def _build_response(self, result):
+        """
+        Build a ScrapeResponse from a ScrapeResult, without the transcript.
+
+        Args:
+            result: ScrapeResult from a scraper
+
+        Returns:
+            ScrapeResponse proto message
+        """
+        response = scraper_pb2.ScrapeResponse(
+            captions=result.captions,
+            original_url=result.original_url,
+            metadata=result.metadata,
+        )
+
+        if result.error:
+            response.error.message = result.error
+            response.error.code = "SCRAPING_ERROR"
+
+        return response
+
+    def _error_response(self, url: str, error: Exception):
+        """
+        Build a ScrapeResponse for an unexpected failure.
+
+        Args:
+            url: Requested URL
+            error: The exception raised while scraping
+
+        Returns:
+            ScrapeResponse proto message
+        """
+        return scraper_pb2.ScrapeResponse(
+            captions="",
+            transcript="",
+            original_url=url,
+            metadata={},
+            error=scraper_pb2.Error(
+                message=str(error),
+                code="INTERNAL_ERROR"
             )
+        )
 
     def _convert_platform(self, proto_platform: int) -> Optional[Platform]:
         """
@@ -91,11 +177,6 @@ class ScraperServicer:
         Returns:
             Our Platform enum value or None
         """
-        mapping = {
-            0: Platform.PLATFORM_UNKNOWN,
-            1: Platform.PLATFORM_TIKTOK,
-            2: Platform.PLATFORM_YOUTUBE,
-            3: Platform.PLATFORM_INSTAGRAM,
-            4: Platform.PLATFORM_WEB,
-        }
-        return mapping.get(proto_platform, Platform.PLATFORM_UNKNOWN)
+        if 0 <= proto_platform < len(_PROTO_TO_PLATFORM):
+            return _PROTO_TO_PLATFORM[proto_platform]
+        return Platform.PLATFORM_UNKNOWN
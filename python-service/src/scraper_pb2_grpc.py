@@ -40,6 +40,11 @@ class ScraperServiceStub(object):
                 request_serializer=scraper__pb2.ScrapeRequest.SerializeToString,
                 response_deserializer=scraper__pb2.ScrapeResponse.FromString,
                 _registered_method=True)
+        self.StreamScrapeContent = channel.unary_stream(
+                '/scraper.ScraperService/StreamScrapeContent',
+                request_serializer=scraper__pb2.ScrapeRequest.SerializeToString,
+                response_deserializer=scraper__pb2.ScrapeResponse.FromString,
+                _registered_method=True)
 
 
 class ScraperServiceServicer(object):
@@ -53,6 +58,15 @@ class ScraperServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamScrapeContent(self, request, context):
+        """StreamScrapeContent sends content as it becomes available: the first
+        message carries captions, metadata and any error, and each following
+        message carries the next piece of the transcript
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ScraperServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -61,6 +75,11 @@ def add_ScraperServiceServicer_to_server(servicer, server):
                     request_deserializer=scraper__pb2.ScrapeRequest.FromString,
                     response_serializer=scraper__pb2.ScrapeResponse.SerializeToString,
             ),
+            'StreamScrapeContent': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamScrapeContent,
+                    request_deserializer=scraper__pb2.ScrapeRequest.FromString,
+                    response_serializer=scraper__pb2.ScrapeResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'scraper.ScraperService', rpc_method_handlers)
@@ -99,3 +118,30 @@ class ScraperService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamScrapeContent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/scraper.ScraperService/StreamScrapeContent',
+            scraper__pb2.ScrapeRequest.SerializeToString,
+            scraper__pb2.ScrapeResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
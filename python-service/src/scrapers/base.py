@@ -1,8 +1,11 @@
 """Base scraper interface and data models."""
 
+import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional, Dict
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Optional, Dict, Union
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -36,6 +39,59 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def scrape_stream(
+        self, url: str, transcribe: bool = True
+    ) -> AsyncIterator[Union[ScrapeResult, str]]:
+        """
+        Scrape content from a URL, yielding it as it becomes available.
+
+        The first item is a ScrapeResult without a transcript; any following
+        items are pieces of the transcript. Scrapers whose transcription can
+        produce partial output should override this; the default yields the
+        whole transcript at once after scrape() completes.
+
+        Args:
+            url: The URL to scrape
+            transcribe: Whether to transcribe video audio
+
+        Yields:
+            ScrapeResult first, then transcript strings
+        """
+        result = await self.scrape(url, transcribe=transcribe)
+        yield replace(result, transcript=None)
+        if result.transcript:
+            yield result.transcript
+
+    async def _collect_stream(self, url: str, transcribe: bool = True) -> ScrapeResult:
+        """
+        Run scrape_stream() to completion and combine its items.
+
+        For scrapers that implement scrape() on top of their scrape_stream().
+
+        Args:
+            url: The URL to scrape
+            transcribe: Whether to transcribe video audio
+
+        Returns:
+            The streamed ScrapeResult with the transcript pieces joined; the
+            transcript is empty if the stream failed after the header
+        """
+        result = None
+        transcript_parts = []
+        try:
+            async for item in self.scrape_stream(url, transcribe=transcribe):
+                if result is None:
+                    result = item
+                else:
+                    transcript_parts.append(item)
+        except Exception as e:
+            if result is None:
+                raise
+            # Drop the partial transcript, as a failed transcription always has
+            logger.error(f"Transcription of {url} failed partway: {e}")
+            return replace(result, transcript="")
+        return replace(result, transcript="".join(transcript_parts))
+
     @abstractmethod
     def can_handle(self, url: str) -> bool:
         """
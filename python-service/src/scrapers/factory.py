@@ -1,7 +1,8 @@
 """Scraper factory for selecting the appropriate scraper based on URL."""
 
+import functools
 import logging
-from typing import Optional
+from typing import Callable, Dict, Optional
 from .base import BaseScraper
 from .youtube import YouTubeScraper
 from .tiktok import TikTokScraper
@@ -11,6 +12,9 @@ from ..utils.url_parser import detect_platform, Platform
 
 logger = logging.getLogger(__name__)
 
+# Platform detection is a pure function of the URL; retries resubmit the same URLs
+_detect_platform = functools.lru_cache(maxsize=4096)(detect_platform)
+
 
 class ScraperFactory:
     """Factory for creating platform-specific scrapers."""
@@ -23,12 +27,31 @@ class ScraperFactory:
             output_dir: Directory for temporary files
         """
         self.output_dir = output_dir
-        self._scrapers = {
-            Platform.PLATFORM_YOUTUBE: YouTubeScraper(output_dir),
-            Platform.PLATFORM_TIKTOK: TikTokScraper(output_dir),
-            Platform.PLATFORM_INSTAGRAM: InstagramScraper(output_dir),
-            Platform.PLATFORM_WEB: WebScraper(),
+        # Scrapers are built on first use so unused platforms never load their clients
+        self._scraper_factories: Dict[Platform, Callable[[], BaseScraper]] = {
+            Platform.PLATFORM_YOUTUBE: lambda: YouTubeScraper(output_dir),
+            Platform.PLATFORM_TIKTOK: lambda: TikTokScraper(output_dir),
+            Platform.PLATFORM_INSTAGRAM: lambda: InstagramScraper(output_dir),
+            Platform.PLATFORM_WEB: WebScraper,
         }
+        self._scrapers: Dict[Platform, BaseScraper] = {}
+
+    def get_scraper_for_platform(self, platform: Platform) -> BaseScraper:
+        """
+        Get the scraper for a platform, creating it on first use.
+
+        Args:
+            platform: Platform with a registered scraper
+
+        Returns:
+            Cached BaseScraper instance for the platform
+        """
+        scraper = self._scrapers.get(platform)
+        if scraper is None:
+            logger.info(f"Initializing {platform.name} scraper")
+            scraper = self._scraper_factories[platform]()
+            self._scrapers[platform] = scraper
+        return scraper
 
     def get_scraper(self, url: str, platform: Optional[Platform] = None) -> BaseScraper:
         """
@@ -42,23 +65,28 @@ class ScraperFactory:
             Appropriate BaseScraper instance
         """
         # Detect platform if not provided
-        if platform is None or platform == Platform.PLATFORM_UNKNOWN:
-            platform = detect_platform(url)
+        detected = platform is None or platform == Platform.PLATFORM_UNKNOWN
+        if detected:
+            platform = _detect_platform(url)
 
         # Get the specific scraper or fall back to web scraper
-        scraper = self._scrapers.get(platform)
-
-        if scraper is None or platform == Platform.PLATFORM_WEB:
+        if platform not in self._scraper_factories or platform == Platform.PLATFORM_WEB:
             logger.info(f"Using web scraper for {url}")
-            return self._scrapers[Platform.PLATFORM_WEB]
+            return self.get_scraper_for_platform(Platform.PLATFORM_WEB)
 
-        # Verify the scraper can handle this URL
-        if not scraper.can_handle(url):
+        # Verify a platform hint against the URL (detection already implies it)
+        if not detected and _detect_platform(url) != platform:
             logger.warning(f"Platform scraper cannot handle {url}, using web scraper")
-            return self._scrapers[Platform.PLATFORM_WEB]
+            return self.get_scraper_for_platform(Platform.PLATFORM_WEB)
 
         logger.info(f"Using {platform.name} scraper for {url}")
-        return scraper
+        return self.get_scraper_for_platform(platform)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_factory() -> ScraperFactory:
+    """Get the shared factory used by scrape_url()."""
+    return ScraperFactory()
 
 
 async def scrape_url(url: str, platform: Optional[Platform] = None, transcribe: bool = True) -> 'ScrapeResult':
@@ -73,6 +101,5 @@ async def scrape_url(url: str, platform: Optional[Platform] = None, transcribe:
     Returns:
         ScrapeResult with extracted content
     """
-    factory = ScraperFactory()
-    scraper = factory.get_scraper(url, platform)
+    scraper = _default_factory().get_scraper(url, platform)
     return await scraper.scrape(url, transcribe)
@@ -1,15 +1,31 @@
 """Instagram scraper implementation."""
 
+import asyncio
 import logging
+import os
+import re
+import threading
+import aiohttp
 import instaloader
-from pathlib import Path
+from cachetools import TTLCache
+from typing import AsyncIterator, Dict, Union
 from .base import BaseScraper, ScrapeResult
 from ..video.audio_extractor import AudioExtractor
 from ..video.transcriber import create_transcriber
 from ..utils.cleanup import cleanup_files
+from ..utils.http import get_session
+from ..utils.url_parser import detect_platform, Platform
 
 logger = logging.getLogger(__name__)
 
+# Post, reel and IGTV links, optionally prefixed by the owner's username
+_SHORTCODE_RE = re.compile(r"instagram\.com/(?:[^/?#]+/)?(?:p|reels?|tv)/([A-Za-z0-9_-]+)")
+
+# Post metadata by shortcode, so repeat links skip instaloader's metadata request.
+# _get_post runs in worker threads, so access goes through the lock.
+_POST_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_POST_CACHE_LOCK = threading.Lock()
+
 
 class InstagramScraper(BaseScraper):
     """Scraper for Instagram posts/reels."""
@@ -21,24 +37,19 @@ class InstagramScraper(BaseScraper):
         Args:
             output_dir: Directory for temporary files
         """
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.loader = instaloader.Instaloader(
-            dirname_pattern=str(self.output_dir),
-            filename_pattern='{shortcode}',
-            download_pictures=False,
-            download_video_thumbnails=False,
-            download_geotags=False,
-            download_comments=False,
-            save_metadata=False,
-            compress_json=False,
-        )
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self.loader = instaloader.Instaloader()
+        # The loader's context (HTTP session and rate controller) is not
+        # thread-safe, so concurrent requests take turns using it
+        self._loader_lock = threading.Lock()
+        self.download_timeout = aiohttp.ClientTimeout(total=300)
         self.audio_extractor = AudioExtractor()
         self.transcriber = create_transcriber()
 
     def can_handle(self, url: str) -> bool:
         """Check if this scraper can handle the URL."""
-        return 'instagram.com' in url.lower()
+        return detect_platform(url) == Platform.PLATFORM_INSTAGRAM
 
     async def scrape(self, url: str, transcribe: bool = True) -> ScrapeResult:
         """
@@ -51,8 +62,27 @@ class InstagramScraper(BaseScraper):
         Returns:
             ScrapeResult with extracted content
         """
+        return await self._collect_stream(url, transcribe)
+
+    async def scrape_stream(
+        self, url: str, transcribe: bool = True
+    ) -> AsyncIterator[Union[ScrapeResult, str]]:
+        """
+        Scrape an Instagram post/reel, yielding the caption before the transcript.
+
+        Args:
+            url: Instagram post/reel URL
+            transcribe: Whether to transcribe the audio (for videos)
+
+        Yields:
+            ScrapeResult without a transcript, then transcript pieces as each
+            part of the audio is transcribed
+        """
         video_path = None
         audio_path = None
+        shortcode = None
+        header_sent = False
+        transcript_started = False
 
         try:
             logger.info(f"Scraping Instagram post: {url}")
@@ -63,61 +93,59 @@ class InstagramScraper(BaseScraper):
                 raise ValueError("Could not extract shortcode from URL")
 
             # Get post
-            post = instaloader.Post.from_shortcode(
-                self.loader.context,
-                shortcode
-            )
+            post = await asyncio.to_thread(self._get_post, shortcode)
 
-            captions = post.caption or ""
+            captions = post['caption']
             metadata = {
                 'title': captions[:100] if captions else "Instagram Post",
-                'author': post.owner_username,
-                'likes': str(post.likes),
+                'author': post['owner_username'],
+                'likes': str(post['likes']),
             }
 
-            transcript = ""
+            # Caption and metadata go out before the video download
+            header_sent = True
+            yield ScrapeResult(
+                captions=captions,
+                description=captions,
+                transcript=None,
+                original_url=url,
+                metadata=metadata,
+            )
 
             # Only process if it's a video
-            if post.is_video:
+            if post['video_url'] and transcribe:
                 try:
                     # Download the video
-                    video_filename = f"{shortcode}.mp4"
-                    video_path = str(self.output_dir / video_filename)
-
-                    self.loader.download_post(post, target=shortcode)
+                    video_path = os.path.join(self.output_dir, f"{shortcode}.mp4")
+                    await self._download_video(post['video_url'], video_path)
 
-                    # Find the downloaded video file
-                    downloaded_files = list(self.output_dir.glob(f"{shortcode}*.mp4"))
-                    if downloaded_files:
-                        video_path = str(downloaded_files[0])
+                    # Extract audio
+                    logger.info("Extracting audio from Instagram video")
+                    audio_path = await asyncio.to_thread(
+                        self.audio_extractor.extract_audio, video_path
+                    )
 
-                        if transcribe:
-                            # Extract audio
-                            logger.info("Extracting audio from Instagram video")
-                            audio_path = self.audio_extractor.extract_audio(video_path)
-
-                            # Transcribe audio
-                            logger.info("Transcribing Instagram audio")
-                            transcript = self.transcriber.transcribe(audio_path)
+                    # Transcribe audio
+                    logger.info("Transcribing Instagram audio")
+                    async for piece in self.transcriber.atranscribe_stream(audio_path):
+                        transcript_started = True
+                        yield piece
 
                 except Exception as e:
                     logger.error(f"Failed to process Instagram video: {e}")
+                    if transcript_started:
+                        # Part of the transcript is already out; fail the scrape
+                        # rather than end on a silently truncated transcript
+                        raise
                     # Continue without transcript
 
-            result = ScrapeResult(
-                captions=captions,
-                description=captions,
-                transcript=transcript,
-                original_url=url,
-                metadata=metadata,
-            )
-
             logger.info(f"Successfully scraped Instagram post by {metadata.get('author')}")
-            return result
 
         except Exception as e:
             logger.error(f"Failed to scrape Instagram post {url}: {e}")
-            return ScrapeResult(
+            if header_sent:
+                raise
+            yield ScrapeResult(
                 captions="",
                 description="",
                 transcript="",
@@ -129,15 +157,49 @@ class InstagramScraper(BaseScraper):
         finally:
             # Clean up temporary files
             cleanup_files(video_path, audio_path)
-            # Clean up instaloader files
-            if video_path:
-                shortcode = self._extract_shortcode(url)
-                if shortcode:
-                    for file in self.output_dir.glob(f"{shortcode}*"):
-                        try:
-                            file.unlink()
-                        except Exception:
-                            pass
+
+    def _get_post(self, shortcode: str) -> Dict:
+        """
+        Fetch post metadata, reusing recently fetched posts.
+
+        Args:
+            shortcode: Instagram shortcode
+
+        Returns:
+            Dictionary with 'caption', 'owner_username', 'likes' and
+            'video_url' (None for non-video posts)
+        """
+        with _POST_CACHE_LOCK:
+            post = _POST_CACHE.get(shortcode)
+        if post is not None:
+            return post
+
+        with self._loader_lock:
+            instagram_post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
+            post = {
+                'caption': instagram_post.caption or "",
+                'owner_username': instagram_post.owner_username,
+                'likes': instagram_post.likes,
+                'video_url': instagram_post.video_url if instagram_post.is_video else None,
+            }
+
+        with _POST_CACHE_LOCK:
+            _POST_CACHE[shortcode] = post
+        return post
+
+    async def _download_video(self, video_url: str, video_path: str) -> None:
+        """
+        Stream a post's video straight from the CDN to disk.
+
+        Args:
+            video_url: Video URL from the post metadata
+            video_path: Destination file path
+        """
+        async with get_session().get(video_url, timeout=self.download_timeout) as response:
+            response.raise_for_status()
+            with open(video_path, 'wb') as video_file:
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    video_file.write(chunk)
 
     def _extract_shortcode(self, url: str) -> str:
         """
@@ -152,9 +214,5 @@ class InstagramScraper(BaseScraper):
         # Handle different Instagram URL formats
         # https://www.instagram.com/p/SHORTCODE/
         # https://www.instagram.com/reel/SHORTCODE/
-        parts = url.rstrip('/').split('/')
-        if 'p' in parts or 'reel' in parts:
-            idx = parts.index('p') if 'p' in parts else parts.index('reel')
-            if idx + 1 < len(parts):
-                return parts[idx + 1]
-        return ""
+        match = _SHORTCODE_RE.search(url)
+        return match.group(1) if match else ""
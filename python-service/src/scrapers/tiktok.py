@@ -1,11 +1,14 @@
 """TikTok scraper implementation."""
 
+import asyncio
 import logging
+from typing import AsyncIterator, Union
 from .base import BaseScraper, ScrapeResult
 from ..video.downloader import VideoDownloader
 from ..video.audio_extractor import AudioExtractor
 from ..video.transcriber import create_transcriber
 from ..utils.cleanup import cleanup_files
+from ..utils.url_parser import detect_platform, Platform
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,7 @@ class TikTokScraper(BaseScraper):
 
     def can_handle(self, url: str) -> bool:
         """Check if this scraper can handle the URL."""
-        return 'tiktok.com' in url.lower()
+        return detect_platform(url) == Platform.PLATFORM_TIKTOK
 
     async def scrape(self, url: str, transcribe: bool = True) -> ScrapeResult:
         """
@@ -39,53 +42,87 @@ class TikTokScraper(BaseScraper):
         Returns:
             ScrapeResult with extracted content
         """
+        return await self._collect_stream(url, transcribe)
+
+    async def scrape_stream(
+        self, url: str, transcribe: bool = True
+    ) -> AsyncIterator[Union[ScrapeResult, str]]:
+        """
+        Scrape a TikTok video, yielding captions and metadata before the transcript.
+
+        Args:
+            url: TikTok video URL
+            transcribe: Whether to transcribe the audio
+
+        Yields:
+            ScrapeResult without a transcript, then transcript pieces as each
+            part of the audio is transcribed
+        """
         video_path = None
         audio_path = None
+        header_sent = False
+        transcript_started = False
 
         try:
             logger.info(f"Scraping TikTok video: {url}")
 
-            # Download video and extract metadata
-            download_result = self.downloader.download(url, platform='tiktok')
-            video_path = download_result['video_path']
+            if transcribe:
+                # Download video and extract metadata
+                video_info = await asyncio.to_thread(
+                    self.downloader.download, url, platform='tiktok'
+                )
+                video_path = video_info['video_path']
+            else:
+                # The video file is only needed for transcription
+                video_info = await asyncio.to_thread(self.downloader.extract_metadata, url)
 
             # TikTok description is usually the caption
-            captions = download_result.get('description', '')
+            captions = video_info.get('description', '')
             metadata = {
-                'title': download_result.get('title', ''),
-                'author': download_result.get('author', ''),
-                'duration': str(download_result.get('duration', 0)),
+                'title': video_info.get('title', ''),
+                'author': video_info.get('author', ''),
+                'duration': str(video_info.get('duration', 0)),
             }
 
-            transcript = ""
+            # Captions and metadata go out before the slow transcription
+            header_sent = True
+            yield ScrapeResult(
+                captions=captions,
+                description=captions,
+                transcript=None,
+                original_url=url,
+                metadata=metadata,
+            )
+
             if transcribe:
                 try:
                     # Extract audio from video
                     logger.info("Extracting audio from TikTok video")
-                    audio_path = self.audio_extractor.extract_audio(video_path)
+                    audio_path = await asyncio.to_thread(
+                        self.audio_extractor.extract_audio, video_path
+                    )
 
                     # Transcribe audio
                     logger.info("Transcribing TikTok audio")
-                    transcript = self.transcriber.transcribe(audio_path)
+                    async for piece in self.transcriber.atranscribe_stream(audio_path):
+                        transcript_started = True
+                        yield piece
 
                 except Exception as e:
                     logger.error(f"Transcription failed: {e}")
+                    if transcript_started:
+                        # Part of the transcript is already out; fail the scrape
+                        # rather than end on a silently truncated transcript
+                        raise
                     # Continue without transcript
 
-            result = ScrapeResult(
-                captions=captions,
-                description=captions,
-                transcript=transcript,
-                original_url=url,
-                metadata=metadata,
-            )
-
             logger.info(f"Successfully scraped TikTok video: {metadata.get('title')}")
-            return result
 
         except Exception as e:
             logger.error(f"Failed to scrape TikTok video {url}: {e}")
-            return ScrapeResult(
+            if header_sent:
+                raise
+            yield ScrapeResult(
                 captions="",
                 description="",
                 transcript="",
@@ -1,23 +1,32 @@
 """Generic web scraper for recipe websites."""
 
+import asyncio
 import logging
-import requests
-from bs4 import BeautifulSoup
+import os
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from selectolax.lexbor import LexborHTMLParser
 from typing import Optional, Dict
 from .base import BaseScraper, ScrapeResult
+from ..utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
+# Parsed pages by URL: url -> (ScrapeResult, ETag or None)
+_PAGE_CACHE = TTLCache(maxsize=1024, ttl=3600)
+
+# HTML parsing is CPU-bound, so it runs here instead of on the event loop
+_PARSE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='web-parse')
+
 
 class WebScraper(BaseScraper):
     """Scraper for generic web pages, especially recipe websites."""
 
     def __init__(self):
         """Initialize web scraper."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.timeout = aiohttp.ClientTimeout(total=30)
 
     def can_handle(self, url: str) -> bool:
         """Check if this scraper can handle the URL."""
@@ -38,40 +47,29 @@ class WebScraper(BaseScraper):
         try:
             logger.info(f"Scraping web page: {url}")
 
-            # Fetch the page
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Try to extract structured recipe data (schema.org)
-            recipe_data = self._extract_recipe_schema(soup)
-            if recipe_data:
-                logger.info("Found structured recipe data")
-                return ScrapeResult(
-                    captions=recipe_data.get('description', ''),
-                    description=recipe_data.get('description', ''),
-                    transcript="",  # No transcript for web pages
-                    original_url=url,
-                    metadata=recipe_data,
-                )
-
-            # Fallback: extract all text content
-            logger.info("No structured data found, extracting all text")
-            text_content = self._extract_text_content(soup)
-
-            metadata = {
-                'title': soup.title.string if soup.title else '',
-            }
-
-            result = ScrapeResult(
-                captions=text_content,
-                description=text_content,
-                transcript="",
-                original_url=url,
-                metadata=metadata,
-            )
-
+            # Serve repeat URLs from the cache, revalidating with the ETag if we have one
+            cached = _PAGE_CACHE.get(url)
+            headers = {}
+            if cached is not None:
+                cached_result, etag = cached
+                if not etag:
+                    logger.info("Using cached web page")
+                    return cached_result
+                headers['If-None-Match'] = etag
+
+            # Fetch the page without blocking the event loop
+            async with get_session().get(url, headers=headers, timeout=self.timeout) as response:
+                if cached is not None and response.status == 304:
+                    logger.info("Web page not modified, using cached result")
+                    return cached_result
+                response.raise_for_status()
+                content = await response.read()
+                etag = response.headers.get('ETag')
+
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(_PARSE_POOL, self._parse, content, url)
+
+            _PAGE_CACHE[url] = (result, etag)
             logger.info("Successfully scraped web page")
             return result
 
@@ -86,23 +84,68 @@ class WebScraper(BaseScraper):
                 error=str(e),
             )
 
-    def _extract_recipe_schema(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _parse(self, content: bytes, url: str) -> ScrapeResult:
+        """
+        Parse a fetched page into a scrape result.
+
+        Args:
+            content: Raw page content
+            url: Web page URL
+
+        Returns:
+            ScrapeResult with extracted content
+        """
+        tree = LexborHTMLParser(content)
+
+        # Try to extract structured recipe data (schema.org)
+        recipe_data = self._extract_recipe_schema(tree)
+        if recipe_data:
+            logger.info("Found structured recipe data")
+            return ScrapeResult(
+                captions=recipe_data.get('description', ''),
+                description=recipe_data.get('description', ''),
+                transcript="",  # No transcript for web pages
+                original_url=url,
+                metadata=recipe_data,
+            )
+
+        # Fallback: extract all text content
+        logger.info("No structured data found, extracting all text")
+        title = tree.css_first('title')
+        metadata = {
+            'title': title.text() if title else '',
+        }
+
+        text_content = self._extract_text_content(tree)
+
+        return ScrapeResult(
+            captions=text_content,
+            description=text_content,
+            transcript="",
+            original_url=url,
+            metadata=metadata,
+        )
+
+    def _extract_recipe_schema(self, tree: LexborHTMLParser) -> Optional[Dict]:
         """
         Extract recipe data from schema.org markup.
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed HTML document
 
         Returns:
             Dictionary with recipe data or None
         """
-        import json
-
         # Look for JSON-LD schema
-        scripts = soup.find_all('script', type='application/ld+json')
+        scripts = tree.css('script[type="application/ld+json"]')
         for script in scripts:
+            raw = script.text()
+            # Only decode blocks that can contain a Recipe (skips Organization, BreadcrumbList, ...)
+            if '"Recipe"' not in raw:
+                continue
+
             try:
-                data = json.loads(script.string)
+                data = orjson.loads(raw)
 
                 # Handle both single objects and arrays
                 if isinstance(data, list):
@@ -143,28 +186,30 @@ class WebScraper(BaseScraper):
                         'servings': str(data.get('recipeYield', '')),
                     }
 
-            except (json.JSONDecodeError, AttributeError, KeyError) as e:
+            except (orjson.JSONDecodeError, AttributeError, KeyError) as e:
                 logger.debug(f"Failed to parse schema: {e}")
                 continue
 
         return None
 
-    def _extract_text_content(self, soup: BeautifulSoup) -> str:
+    def _extract_text_content(self, tree: LexborHTMLParser) -> str:
         """
         Extract readable text content from the page.
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed HTML document
 
         Returns:
             Extracted text
         """
         # Remove script and style elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
+        tree.strip_tags(['script', 'style', 'nav', 'footer', 'header'])
 
         # Get text and clean it
-        text = soup.get_text(separator='\n')
+        body = tree.body
+        if body is None:
+            return ''
+        text = body.text(separator='\n')
 
         # Clean up whitespace
         lines = [line.strip() for line in text.splitlines()]
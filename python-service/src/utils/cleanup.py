@@ -20,11 +20,11 @@ def cleanup_files(*file_paths: str) -> None:
             continue
 
         try:
-            path = Path(file_path)
-            if path.exists() and path.is_file():
-                path.unlink()
-                logger.debug(f"Deleted temporary file: {file_path}")
-        except Exception as e:
+            os.unlink(file_path)
+            logger.debug(f"Deleted temporary file: {file_path}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
             logger.warning(f"Failed to delete temporary file {file_path}: {e}")
 
 
@@ -37,22 +37,23 @@ def cleanup_directory(directory: str, extensions: List[str] = None) -> None:
         extensions: List of file extensions to delete (e.g., ['.mp4', '.mp3'])
                    If None, deletes all files
     """
-    try:
-        dir_path = Path(directory)
-        if not dir_path.exists() or not dir_path.is_dir():
-            return
-
-        for file_path in dir_path.iterdir():
-            if not file_path.is_file():
-                continue
-
-            if extensions is None or file_path.suffix in extensions:
-                try:
-                    file_path.unlink()
-                    logger.debug(f"Deleted: {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {file_path}: {e}")
+    suffixes = tuple(extensions) if extensions is not None else None
 
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                if suffixes is None or entry.name.endswith(suffixes):
+                    try:
+                        os.unlink(entry.path)
+                        logger.debug(f"Deleted: {entry.path}")
+                    except OSError as e:
+                        logger.warning(f"Failed to delete {entry.path}: {e}")
+
+    except (FileNotFoundError, NotADirectoryError):
+        return
     except Exception as e:
         logger.error(f"Failed to cleanup directory {directory}: {e}")
 
@@ -0,0 +1,45 @@
+"""Shared HTTP client session."""
+
+import asyncio
+import logging
+import weakref
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# One session per event loop: a session and its connection pool are bound to
+# the loop that created them, and each asyncio.run() starts a new loop
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session for the running event loop, creating it on first use.
+
+    Must be called from the running event loop.
+
+    Returns:
+        aiohttp ClientSession with a keep-alive connection pool
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+            headers={'User-Agent': USER_AGENT},
+        )
+        _sessions[loop] = session
+        logger.debug("Created shared HTTP session")
+    return session
+
+
+async def close_session() -> None:
+    """Close the running event loop's HTTP session if it was created."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
@@ -1,5 +1,6 @@
 """URL parsing and platform detection utilities."""
 
+import re
 from enum import IntEnum
 from urllib.parse import urlparse
 
@@ -13,6 +14,27 @@ class Platform(IntEnum):
     PLATFORM_WEB = 4
 
 
+# Platform -> domain tokens; each platform becomes one capture group so the
+# matching group index identifies the platform in a single pass over the URL
+_PLATFORM_DOMAINS = (
+    (Platform.PLATFORM_TIKTOK, ('tiktok.com',)),
+    (Platform.PLATFORM_YOUTUBE, ('youtube.com', 'youtu.be')),
+    (Platform.PLATFORM_INSTAGRAM, ('instagram.com',)),
+)
+_PLATFORM_PATTERN = re.compile(
+    '|'.join(
+        '(' + '|'.join(re.escape(domain) for domain in domains) + ')'
+        for _, domains in _PLATFORM_DOMAINS
+    ),
+    re.IGNORECASE,
+)
+_GROUP_PLATFORMS = tuple(platform for platform, _ in _PLATFORM_DOMAINS)
+
+# scheme://netloc followed by the path; query and fragment are left out.
+# Inputs this does not match fall back to urlparse.
+_URL_RE = re.compile(r"^([a-z][a-z0-9+\-.]*)://([^/?#]+)([^?#]*)", re.IGNORECASE)
+
+
 def detect_platform(url: str) -> Platform:
     """
     Detect the platform from a URL.
@@ -23,16 +45,10 @@ def detect_platform(url: str) -> Platform:
     Returns:
         Platform enum value
     """
-    url_lower = url.lower()
-
-    if 'tiktok.com' in url_lower:
-        return Platform.PLATFORM_TIKTOK
-    elif 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-        return Platform.PLATFORM_YOUTUBE
-    elif 'instagram.com' in url_lower:
-        return Platform.PLATFORM_INSTAGRAM
-    else:
+    match = _PLATFORM_PATTERN.search(url)
+    if match is None:
         return Platform.PLATFORM_WEB
+    return _GROUP_PLATFORMS[match.lastindex - 1]
 
 
 def normalize_url(url: str) -> str:
@@ -45,8 +61,14 @@ def normalize_url(url: str) -> str:
     Returns:
         Normalized URL
     """
-    parsed = urlparse(url)
     # Remove fragments and common tracking params
+    match = _URL_RE.match(url)
+    if match is not None:
+        # Like urlparse's .path, drop params (";x") on the last path segment
+        head, slash, last = match[3].rpartition('/')
+        return f"{match[1].lower()}://{match[2]}{head}{slash}{last.split(';', 1)[0]}"
+
+    parsed = urlparse(url)
     return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
 
@@ -60,6 +82,9 @@ def is_valid_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    if _URL_RE.match(url):
+        return True
+
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -1,12 +1,67 @@
-"""Audio extraction from video files using FFmpeg."""
+"""Audio extraction from video files using FFmpeg (via PyAV)."""
 
+import functools
 import logging
-import ffmpeg
-from pathlib import Path
+import math
+import os
+import av
+from typing import List
 
 logger = logging.getLogger(__name__)
 
 
+# Names of ffmpeg's MP3 decoders (fixed and floating point)
+_MP3_DECODERS = ('mp3', 'mp3float')
+
+
+@functools.lru_cache(maxsize=512)
+def _probe_cached(path: str, size: int, mtime_ns: int) -> dict:
+    """
+    Probe a media file in-process; size and mtime_ns invalidate entries for rewritten files.
+
+    Returns:
+        ffprobe-style dict with 'format' (duration) and 'streams' (codec_type,
+        codec_name, and for audio sample_rate and channels)
+    """
+    with av.open(path) as container:
+        streams = []
+        for stream in container.streams:
+            info = {
+                'codec_type': stream.type,
+                'codec_name': stream.codec_context.name,
+            }
+            if stream.type == 'audio':
+                info['sample_rate'] = str(stream.codec_context.sample_rate)
+                info['channels'] = stream.codec_context.channels
+            streams.append(info)
+
+        duration = container.duration
+        return {
+            'format': {
+                'duration': str(duration / av.time_base) if duration is not None else None,
+            },
+            'streams': streams,
+        }
+
+
+def _probe(path: str) -> dict:
+    """Probe a media file, reusing the result while the file is unchanged."""
+    st = os.stat(path)
+    return _probe_cached(path, st.st_size, st.st_mtime_ns)
+
+
+def _is_speech_ready(probe: dict) -> bool:
+    """Check whether the first audio stream is already 16 kHz mono MP3."""
+    for stream in probe.get('streams', []):
+        if stream.get('codec_type') == 'audio':
+            return (
+                stream.get('codec_name') in _MP3_DECODERS
+                and stream.get('sample_rate') == '16000'
+                and stream.get('channels') == 1
+            )
+    return False
+
+
 class AudioExtractor:
     """Extracts audio from video files."""
 
@@ -27,32 +82,61 @@ class AudioExtractor:
         """
         if audio_path is None:
             # Generate audio path from video path
-            video_path_obj = Path(video_path)
-            audio_path = str(video_path_obj.with_suffix('.mp3'))
+            audio_path = os.path.splitext(video_path)[0] + '.mp3'
 
         try:
-            # Extract audio using ffmpeg
-            stream = ffmpeg.input(video_path)
-            stream = ffmpeg.output(
-                stream,
-                audio_path,
-                acodec='libmp3lame',
-                audio_bitrate='128k',
-                ar='16000',  # 16kHz sample rate (good for speech recognition)
-                ac=1,  # Mono channel
-            )
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
+            speech_ready = _is_speech_ready(_probe(video_path))
+            if speech_ready and os.path.abspath(video_path) == os.path.abspath(audio_path):
+                logger.info(f"Audio already in target format: {audio_path}")
+                return audio_path
+
+            # Decode and encode in-process instead of spawning an ffmpeg binary
+            with av.open(video_path) as source, av.open(audio_path, mode='w', format='mp3') as output:
+                in_stream = source.streams.audio[0]
+                if speech_ready:
+                    # Already 16kHz mono MP3, so copy the stream without re-encoding
+                    AudioExtractor._copy_stream(source, in_stream, output)
+                else:
+                    AudioExtractor._encode_stream(source, in_stream, output)
 
             logger.info(f"Extracted audio to: {audio_path}")
             return audio_path
 
-        except ffmpeg.Error as e:
+        except av.FFmpegError as e:
             logger.error(f"FFmpeg error extracting audio from {video_path}: {e}")
             raise
         except Exception as e:
             logger.error(f"Failed to extract audio from {video_path}: {e}")
             raise
 
+    @staticmethod
+    def _copy_stream(source, in_stream, output) -> None:
+        """Remux audio packets from source into output without decoding them."""
+        out_stream = output.add_stream(template=in_stream)
+        for packet in source.demux(in_stream):
+            # The demuxer yields an empty flush packet at the end
+            if packet.dts is None:
+                continue
+            packet.stream = out_stream
+            output.mux(packet)
+
+    @staticmethod
+    def _encode_stream(source, in_stream, output) -> None:
+        """Decode audio from source and encode it into output as 16kHz mono MP3."""
+        out_stream = output.add_stream('libmp3lame', rate=16000, layout='mono')
+        out_stream.bit_rate = 128000
+        # 16kHz sample rate (good for speech recognition), mono channel
+        resampler = av.AudioResampler(format='s16p', layout='mono', rate=16000)
+
+        for frame in source.decode(in_stream):
+            for resampled in resampler.resample(frame):
+                output.mux(out_stream.encode(resampled))
+
+        # Drain the resampler and the encoder
+        for resampled in resampler.resample(None):
+            output.mux(out_stream.encode(resampled))
+        output.mux(out_stream.encode(None))
+
     @staticmethod
     def get_audio_duration(audio_path: str) -> float:
         """
@@ -68,9 +152,88 @@ class AudioExtractor:
             Exception: If probe fails
         """
         try:
-            probe = ffmpeg.probe(audio_path)
+            probe = _probe(audio_path)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
             logger.error(f"Failed to get audio duration for {audio_path}: {e}")
             raise
+
+    @staticmethod
+    def chunk_audio(
+        audio_path: str,
+        output_dir: str,
+        chunk_s: float = 60.0,
+        overlap_s: float = 1.0,
+    ) -> List[str]:
+        """
+        Split an audio file into fixed-length chunks without re-encoding.
+
+        Each chunk starts chunk_s seconds after the previous one and runs
+        overlap_s seconds past the next chunk's start, so words cut at a
+        boundary appear whole in one of the two chunks.
+
+        Args:
+            audio_path: Path to the audio file
+            output_dir: Directory for the chunk files
+            chunk_s: Chunk length in seconds, excluding the overlap
+            overlap_s: Seconds each chunk shares with the next one
+
+        Returns:
+            Paths of the chunk files, in playback order
+
+        Raises:
+            Exception: If splitting fails
+        """
+        try:
+            duration = AudioExtractor.get_audio_duration(audio_path)
+            stem = os.path.splitext(os.path.basename(audio_path))[0]
+            paths = [
+                os.path.join(output_dir, f"{stem}_{index:04d}.mp3")
+                for index in range(max(1, math.ceil(duration / chunk_s)))
+            ]
+
+            open_chunks = {}
+            with av.open(audio_path) as source:
+                in_stream = source.streams.audio[0]
+                try:
+                    for packet in source.demux(in_stream):
+                        # The demuxer yields an empty flush packet at the end
+                        if packet.dts is None:
+                            continue
+                        pts = packet.pts if packet.pts is not None else packet.dts
+                        index = min(int(pts * in_stream.time_base // chunk_s), len(paths) - 1)
+
+                        # The packet also belongs to the previous chunk's overlap
+                        targets = [index]
+                        if index > 0 and pts * in_stream.time_base < index * chunk_s + overlap_s:
+                            targets.insert(0, index - 1)
+
+                        for target in targets:
+                            if target not in open_chunks:
+                                output = av.open(paths[target], mode='w', format='mp3')
+                                open_chunks[target] = (
+                                    output,
+                                    output.add_stream(template=in_stream),
+                                    pts,
+                                )
+                            output, out_stream, start_pts = open_chunks[target]
+                            # Rebase timestamps so every chunk starts at zero
+                            packet.pts = pts - start_pts
+                            packet.dts = pts - start_pts
+                            packet.stream = out_stream
+                            output.mux(packet)
+
+                        # Chunks that end before this packet are complete
+                        for done in [i for i in open_chunks if i < targets[0]]:
+                            open_chunks.pop(done)[0].close()
+                finally:
+                    for output, _, _ in open_chunks.values():
+                        output.close()
+
+            logger.info(f"Split {audio_path} into {len(paths)} chunks")
+            return paths
+
+        except Exception as e:
+            logger.error(f"Failed to split audio {audio_path}: {e}")
+            raise
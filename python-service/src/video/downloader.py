@@ -1,12 +1,20 @@
 """Video download utilities using yt-dlp."""
 
 import logging
+import os
+import threading
 import yt_dlp
-from pathlib import Path
-from typing import Optional, Dict
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
 
 logger = logging.getLogger(__name__)
 
+# URL (without fragment) -> metadata, shared across downloader instances.
+# extract_metadata runs in worker threads, so access goes through the lock.
+_METADATA_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_METADATA_LOCK = threading.Lock()
+
 
 class VideoDownloader:
     """Handles video downloading from various platforms."""
@@ -18,8 +26,9 @@ class VideoDownloader:
         Args:
             output_dir: Directory to save downloaded videos
         """
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self._output_template = os.path.join(output_dir, '%(id)s.%(ext)s')
 
     def download(self, url: str, platform: str = None) -> Dict[str, str]:
         """
@@ -35,14 +44,14 @@ class VideoDownloader:
         Raises:
             Exception: If download fails
         """
-        output_template = str(self.output_dir / '%(id)s.%(ext)s')
-
         ydl_opts = {
             'format': 'best[ext=mp4]/best',  # Prefer MP4
-            'outtmpl': output_template,
+            'outtmpl': self._output_template,
             'quiet': True,
             'no_warnings': True,
             'extract_flat': False,
+            # Fetch HLS/DASH fragments in parallel
+            'concurrent_fragment_downloads': 4,
         }
 
         try:
@@ -51,7 +60,7 @@ class VideoDownloader:
 
                 video_id = info.get('id', 'unknown')
                 ext = info.get('ext', 'mp4')
-                video_path = str(self.output_dir / f"{video_id}.{ext}")
+                video_path = os.path.join(self.output_dir, f"{video_id}.{ext}")
 
                 result = {
                     'video_path': video_path,
@@ -68,12 +77,38 @@ class VideoDownloader:
             logger.error(f"Failed to download video from {url}: {e}")
             raise
 
-    def extract_metadata(self, url: str) -> Dict[str, str]:
+    def download_many(
+        self, urls: List[str], platform: str = None, max_workers: int = 4
+    ) -> List[Dict[str, str]]:
+        """
+        Download several videos concurrently.
+
+        Each download runs in its own worker thread with its own YoutubeDL
+        instance, since a single instance is not thread-safe.
+
+        Args:
+            urls: The video URLs
+            platform: Platform name (for optimization)
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Download results in the same order as ``urls``
+
+        Raises:
+            Exception: If any download fails
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda url: self.download(url, platform), urls))
+
+    def extract_metadata(self, url: str, force: bool = False) -> Dict[str, str]:
         """
         Extract video metadata without downloading.
 
+        Results are cached for an hour by URL, ignoring any fragment.
+
         Args:
             url: The video URL
+            force: Fetch fresh metadata even if it is cached
 
         Returns:
             Dictionary with metadata
@@ -81,6 +116,14 @@ class VideoDownloader:
         Raises:
             Exception: If extraction fails
         """
+        # The query is kept: it identifies the video on youtube.com/watch?v=...
+        key = url.strip().split('#', 1)[0]
+        if not force:
+            with _METADATA_LOCK:
+                cached = _METADATA_CACHE.get(key)
+            if cached is not None:
+                return dict(cached)
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -91,7 +134,7 @@ class VideoDownloader:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
-                return {
+                metadata = {
                     'title': info.get('title', ''),
                     'description': info.get('description', ''),
                     'author': info.get('uploader', '') or info.get('channel', ''),
@@ -99,6 +142,10 @@ class VideoDownloader:
                     'thumbnail': info.get('thumbnail', ''),
                 }
 
+            with _METADATA_LOCK:
+                _METADATA_CACHE[key] = metadata
+            return dict(metadata)
+
         except Exception as e:
             logger.error(f"Failed to extract metadata from {url}: {e}")
             raise
@@ -0,0 +1,126 @@
+"""Pipelined download, audio extraction and transcription for batches of videos."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from .audio_extractor import AudioExtractor
+from .downloader import VideoDownloader
+from .transcriber import Transcriber, create_transcriber
+from ..utils.cleanup import cleanup_files
+
+logger = logging.getLogger(__name__)
+
+# Concurrent workers per stage: download, audio extraction, transcription
+_DEFAULT_WORKERS = {"dl": 4, "ext": 2, "tx": 4}
+
+
+async def run_pipeline(
+    urls: List[str],
+    output_dir: str = "/tmp/recipe-bot",
+    workers: Optional[Dict[str, int]] = None,
+    transcriber: Optional[Transcriber] = None,
+    language: str = None,
+) -> List[Dict[str, Any]]:
+    """
+    Download, extract audio from and transcribe several videos with the stages overlapped.
+
+    Each stage has its own worker pool and hands items to the next stage
+    through a bounded queue, so while one video is being transcribed the
+    next ones are already being extracted and downloaded.
+
+    Args:
+        urls: Video URLs to process
+        output_dir: Directory for temporary files
+        workers: Worker count per stage ('dl', 'ext', 'tx'); missing keys use
+                 the defaults (4, 2, 4)
+        transcriber: Transcriber to use (default: create_transcriber())
+        language: Language code passed to the transcriber (optional)
+
+    Returns:
+        One dict per URL, in input order, with 'url', 'transcript' and 'error'
+        (None on success); successful entries also carry the video metadata
+        ('title', 'description', 'author', 'duration')
+    """
+    workers = {**_DEFAULT_WORKERS, **(workers or {})}
+    downloader = VideoDownloader(output_dir)
+    audio_extractor = AudioExtractor()
+    transcriber = transcriber or create_transcriber()
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+    download_queue: asyncio.Queue = asyncio.Queue()
+    # Bounded so downloads don't run far ahead of the slower stages and fill the disk
+    extract_queue: asyncio.Queue = asyncio.Queue(maxsize=workers["ext"] * 2)
+    transcribe_queue: asyncio.Queue = asyncio.Queue(maxsize=workers["tx"] * 2)
+
+    def fail(index: int, error: Exception, *paths: str) -> None:
+        logger.error(f"Pipeline failed for {urls[index]}: {error}")
+        results[index] = {"url": urls[index], "transcript": "", "error": str(error)}
+        cleanup_files(*paths)
+
+    async def download_worker() -> None:
+        while True:
+            index = await download_queue.get()
+            try:
+                video_info = await asyncio.to_thread(downloader.download, urls[index])
+                await extract_queue.put((index, video_info))
+            except Exception as e:
+                fail(index, e)
+            finally:
+                download_queue.task_done()
+
+    async def extract_worker() -> None:
+        while True:
+            index, video_info = await extract_queue.get()
+            video_path = video_info["video_path"]
+            try:
+                audio_path = await asyncio.to_thread(audio_extractor.extract_audio, video_path)
+                await transcribe_queue.put((index, video_info, audio_path))
+            except Exception as e:
+                fail(index, e, video_path)
+            finally:
+                extract_queue.task_done()
+
+    async def transcribe_worker() -> None:
+        while True:
+            index, video_info, audio_path = await transcribe_queue.get()
+            video_path = video_info.pop("video_path")
+            try:
+                transcript = await transcriber.atranscribe(audio_path, language)
+                results[index] = {
+                    "url": urls[index],
+                    **video_info,
+                    "transcript": transcript,
+                    "error": None,
+                }
+            except Exception as e:
+                fail(index, e)
+            finally:
+                cleanup_files(video_path, audio_path)
+                transcribe_queue.task_done()
+
+    tasks = [
+        asyncio.create_task(worker())
+        for worker, count in (
+            (download_worker, workers["dl"]),
+            (extract_worker, workers["ext"]),
+            (transcribe_worker, workers["tx"]),
+        )
+        for _ in range(count)
+    ]
+
+    try:
+        for index in range(len(urls)):
+            download_queue.put_nowait(index)
+
+        # Each stage hands an item on before marking it done, so joining the
+        # queues in stage order waits for every item to leave the pipeline
+        await download_queue.join()
+        await extract_queue.join()
+        await transcribe_queue.join()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return results
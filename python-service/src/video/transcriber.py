@@ -1,11 +1,40 @@
 """Main transcription interface that uses different providers."""
 
+import asyncio
 import logging
 import os
-from typing import Optional
+import tempfile
+import weakref
+from difflib import SequenceMatcher
+from types import MappingProxyType
+from typing import AsyncIterator, List, Optional, Union
+
+from .audio_extractor import AudioExtractor
 
 logger = logging.getLogger(__name__)
 
+# Audio longer than this is split and its chunks transcribed concurrently
+# (google-stt splits anything longer than one chunk)
+_CHUNK_THRESHOLD_S = 120.0
+# Chunk plus overlap stays under the 60s limit of Google STT's synchronous recognize
+_CHUNK_S = 55.0
+_CHUNK_OVERLAP_S = 1.0
+# Words compared at each chunk boundary when removing the repeated overlap
+_OVERLAP_WORDS = 20
+
+# Map common language codes to ElevenLabs format
+_ELEVENLABS_LANGUAGES = MappingProxyType({
+    "en": "eng", "en-US": "eng", "en-GB": "eng",
+    "es": "spa", "es-ES": "spa", "es-MX": "spa",
+    "pt": "por", "pt-BR": "por", "pt-PT": "por",
+    "fr": "fra", "fr-FR": "fra",
+    "de": "deu", "de-DE": "deu",
+    "it": "ita", "it-IT": "ita",
+    "ja": "jpn", "ja-JP": "jpn",
+    "ko": "kor", "ko-KR": "kor",
+    "zh": "cmn", "zh-CN": "cmn", "zh-TW": "cmn",
+})
+
 
 class Transcriber:
     """Main transcription service that delegates to specific providers."""
@@ -16,9 +45,26 @@ class Transcriber:
 
         Args:
             provider: Provider name ('elevenlabs', 'google-stt', or 'whisper')
-            **kwargs: Provider-specific arguments
+            **kwargs: Provider-specific arguments. ``max_concurrency`` caps
+                      concurrent provider requests from atranscribe (default:
+                      TRANSCRIPTION_MAX_CONCURRENCY env var or 4)
         """
         self.provider = provider
+        # Google STT's synchronous recognize rejects audio over 60s, so any
+        # file that would not fit in one chunk is split
+        self._chunk_threshold_s = (
+            _CHUNK_S + _CHUNK_OVERLAP_S if provider == "google-stt" else _CHUNK_THRESHOLD_S
+        )
+
+        self._max_concurrency = kwargs.get(
+            'max_concurrency',
+            int(os.getenv('TRANSCRIPTION_MAX_CONCURRENCY', '4'))
+        )
+        # A semaphore binds to the first loop that waits on it, and a
+        # transcriber can outlive its loop, so each loop gets its own
+        self._sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         if provider == "elevenlabs":
             from .transcription_providers.elevenlabs_stt import ElevenLabsTranscriber
@@ -41,7 +87,10 @@ class Transcriber:
             self.transcriber = WhisperTranscriber(
                 model_name=model_name,
                 use_api=use_api,
-                api_key=api_key
+                api_key=api_key,
+                device=kwargs.get('device'),
+                compute_type=kwargs.get('compute_type'),
+                device_index=kwargs.get('device_index', 0),
             )
 
         else:
@@ -54,6 +103,9 @@ class Transcriber:
         """
         Transcribe an audio file.
 
+        Long local files are split into chunks as in atranscribe(), and the
+        chunks are transcribed one after another.
+
         Args:
             audio_path: Path to the audio file
             language: Language code (optional)
@@ -65,38 +117,264 @@ class Transcriber:
             Exception: If transcription fails
         """
         try:
-            if self.provider == "elevenlabs":
-                # ElevenLabs uses language codes like "eng", "spa", "por"
-                language_code = self._convert_to_elevenlabs_language(language)
-                return self.transcriber.transcribe(audio_path, language_code=language_code)
-            elif self.provider == "google-stt":
-                language_code = language or "en-US"
-                return self.transcriber.transcribe(audio_path, language_code)
-            else:  # whisper
-                return self.transcriber.transcribe(audio_path, language)
+            provider_language = self._provider_language(language)
+            if self._is_long(audio_path):
+                return self._transcribe_chunked(audio_path, provider_language)
+
+            return self.transcriber.transcribe(audio_path, provider_language)
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise
+
+    async def atranscribe(self, audio_path: str, language: str = None) -> str:
+        """
+        Transcribe an audio file without blocking the event loop.
+
+        Local files longer than two minutes (longer than one chunk for
+        google-stt) are split into overlapping chunks of just under a minute
+        that are transcribed concurrently.
+
+        Args:
+            audio_path: Path to the audio file
+            language: Language code (optional)
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            Exception: If transcription fails
+        """
+        return await self._atranscribe_converted(audio_path, self._provider_language(language))
+
+    async def atranscribe_stream(self, audio_path: str, language: str = None) -> AsyncIterator[str]:
+        """
+        Transcribe an audio file, yielding the transcript in pieces as they are ready.
+
+        Long files are split as in atranscribe(), and each chunk's text is
+        yielded as soon as it and every earlier chunk are done. Joining the
+        pieces gives the same text as atranscribe().
+
+        Args:
+            audio_path: Path to the audio file
+            language: Language code (optional)
+
+        Yields:
+            Consecutive pieces of the transcript
+
+        Raises:
+            Exception: If transcription fails
+        """
+        provider_language = self._provider_language(language)
+        try:
+            if not await asyncio.to_thread(self._is_long, audio_path):
+                yield await self._atranscribe_one(audio_path, provider_language)
+                return
+
+            tail: List[str] = []
+            async for text in self._atranscribe_chunks(audio_path, provider_language):
+                words = _trim_overlap(tail, text.split())
+                if words:
+                    piece = " ".join(words)
+                    yield f" {piece}" if tail else piece
+                    tail = (tail + words)[-_OVERLAP_WORDS:]
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise
+
+    async def transcribe_batch(
+        self, paths: List[str], language: Union[str, List[str], None] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Transcribe several audio files concurrently.
+
+        At most ``max_concurrency`` requests run at once.
+
+        Args:
+            paths: Paths to the audio files
+            language: Language code for every file, or one code per file
+                      (optional)
+
+        Returns:
+            Transcripts in the order of ``paths``; a failed file yields its
+            exception instead of a transcript
+        """
+        if isinstance(language, list):
+            if len(language) != len(paths):
+                raise ValueError("Expected one language per path")
+            languages = self._provider_languages(language)
+        else:
+            languages = [self._provider_language(language)] * len(paths)
+
+        return await asyncio.gather(
+            *(
+                self._atranscribe_converted(path, provider_language)
+                for path, provider_language in zip(paths, languages)
+            ),
+            return_exceptions=True,
+        )
+
+    async def _atranscribe_converted(
+        self, audio_path: str, provider_language: Optional[str]
+    ) -> str:
+        """atranscribe with the language already in the provider's format."""
+        try:
+            if await asyncio.to_thread(self._is_long, audio_path):
+                texts = [
+                    text async for text in self._atranscribe_chunks(audio_path, provider_language)
+                ]
+                return _merge_overlapping(texts)
+
+            return await self._atranscribe_one(audio_path, provider_language)
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
 
+    async def _atranscribe_one(self, audio_path: str, provider_language: Optional[str]) -> str:
+        """Send one file to the provider, holding a concurrency slot for the request."""
+        async with self._semaphore():
+            return await self.transcriber.atranscribe(audio_path, provider_language)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limit for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        sem = self._sems.get(loop)
+        if sem is None:
+            sem = self._sems[loop] = asyncio.Semaphore(self._max_concurrency)
+        return sem
+
+    def _is_long(self, audio_path: str) -> bool:
+        """Check whether a file is local and long enough to be split into chunks."""
+        if not os.path.isfile(audio_path):
+            return False
+        try:
+            duration = AudioExtractor.get_audio_duration(audio_path)
+        except Exception as e:
+            # Unprobeable or missing duration: let the provider take the whole file
+            logger.warning(f"Could not read duration of {audio_path}, not chunking: {e}")
+            return False
+        return duration > self._chunk_threshold_s
+
+    def _transcribe_chunked(self, audio_path: str, provider_language: Optional[str]) -> str:
+        """Split a long file and transcribe the chunks one after another."""
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(audio_path)) as chunk_dir:
+            chunks = AudioExtractor.chunk_audio(
+                audio_path, chunk_dir, _CHUNK_S, _CHUNK_OVERLAP_S
+            )
+            logger.info(f"Transcribing {len(chunks)} chunks of {audio_path}")
+            texts = [self.transcriber.transcribe(chunk, provider_language) for chunk in chunks]
+
+        return _merge_overlapping(texts)
+
+    async def _atranscribe_chunks(
+        self, audio_path: str, provider_language: Optional[str]
+    ) -> AsyncIterator[str]:
+        """
+        Split a long file and transcribe the chunks concurrently.
+
+        Yields:
+            Each chunk's transcript, in playback order, as soon as it and
+            every earlier chunk are done
+        """
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(audio_path)) as chunk_dir:
+            chunks = await asyncio.to_thread(
+                AudioExtractor.chunk_audio, audio_path, chunk_dir, _CHUNK_S, _CHUNK_OVERLAP_S
+            )
+            logger.info(f"Transcribing {len(chunks)} chunks of {audio_path}")
+            tasks = [
+                asyncio.ensure_future(self._atranscribe_one(chunk, provider_language))
+                for chunk in chunks
+            ]
+            try:
+                for task in tasks:
+                    yield await task
+            finally:
+                # Stop outstanding requests before their chunk files are removed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _provider_language(self, language: str = None) -> Optional[str]:
+        """Convert a language code to the format the provider expects."""
+        if self.provider == "elevenlabs":
+            # ElevenLabs uses language codes like "eng", "spa", "por"
+            return self._convert_to_elevenlabs_language(language)
+        elif self.provider == "google-stt":
+            return language or "en-US"
+        else:  # whisper
+            return language
+
+    def _provider_languages(self, languages: List[str]) -> List[Optional[str]]:
+        """Convert many language codes to the format the provider expects."""
+        if self.provider == "elevenlabs":
+            return convert_many(languages)
+        return [self._provider_language(language) for language in languages]
+
     def _convert_to_elevenlabs_language(self, language: str) -> Optional[str]:
         """Convert language codes to ElevenLabs format."""
         if not language or language.strip() == "":
             return None  # Auto-detect
 
-        # Map common language codes to ElevenLabs format
-        language_map = {
-            "en": "eng", "en-US": "eng", "en-GB": "eng",
-            "es": "spa", "es-ES": "spa", "es-MX": "spa",
-            "pt": "por", "pt-BR": "por", "pt-PT": "por",
-            "fr": "fra", "fr-FR": "fra",
-            "de": "deu", "de-DE": "deu",
-            "it": "ita", "it-IT": "ita",
-            "ja": "jpn", "ja-JP": "jpn",
-            "ko": "kor", "ko-KR": "kor",
-            "zh": "cmn", "zh-CN": "cmn", "zh-TW": "cmn",
-        }
-        return language_map.get(language, language)
+        return _ELEVENLABS_LANGUAGES.get(language, language)
+
+
+def convert_many(languages: List[str]) -> List[Optional[str]]:
+    """
+    Convert many language codes to ElevenLabs format in one pass.
+
+    Args:
+        languages: Language codes; empty or blank codes mean auto-detect
+
+    Returns:
+        ElevenLabs codes in the same order, None for auto-detect
+    """
+    lookup = _ELEVENLABS_LANGUAGES.get
+    return [
+        lookup(language, language) if language and not language.isspace() else None
+        for language in languages
+    ]
+
+
+def _merge_overlapping(texts: List[str]) -> str:
+    """
+    Join chunk transcripts, dropping words repeated across chunk overlaps.
+
+    Args:
+        texts: Transcripts of consecutive overlapping chunks
+
+    Returns:
+        Combined transcript
+    """
+    merged: List[str] = []
+    for text in texts:
+        merged.extend(_trim_overlap(merged[-_OVERLAP_WORDS:], text.split()))
+    return " ".join(merged)
+
+
+def _trim_overlap(tail: List[str], words: List[str]) -> List[str]:
+    """
+    Drop the words at the start of a chunk that repeat the end of the previous text.
+
+    Args:
+        tail: Last words of the text so far
+        words: Words of the next chunk
+
+    Returns:
+        The chunk's words without the repeated overlap
+    """
+    if not tail or not words:
+        return words
+    tail = tail[-_OVERLAP_WORDS:]
+    head = words[:_OVERLAP_WORDS]
+    match = SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(
+        0, len(tail), 0, len(head)
+    )
+    # Only a run near the end of one chunk and the start of the next is overlap
+    if match.size >= 2 and match.b <= 3 and len(tail) - (match.a + match.size) <= 3:
+        return words[match.b + match.size:]
+    return words
 
 
 def create_transcriber(provider: str = None) -> Transcriber:
@@ -0,0 +1,94 @@
+"""Retry and pacing helpers for transcription provider calls."""
+
+import asyncio
+import functools
+import logging
+import os
+import random
+import time
+
+from aiolimiter import AsyncLimiter
+
+logger = logging.getLogger(__name__)
+
+# Shared by all providers; only one provider is active per process
+rate_limiter = AsyncLimiter(float(os.getenv('TRANSCRIPTION_MAX_RPS', '5')), 1)
+
+_RATE_LIMIT_MARKERS = ('rate limit', 'rate_limit', 'too many requests', 'resource exhausted')
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """
+    Check whether an exception is a provider rate-limit response.
+
+    Args:
+        error: Exception raised by a provider SDK
+
+    Returns:
+        True if the call was rejected for exceeding the rate limit
+    """
+    for attr in ('status_code', 'status', 'code'):
+        if getattr(error, attr, None) == 429:
+            return True
+
+    message = str(error).lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+def _backoff(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with jitter for the given attempt (0-based)."""
+    return min(cap, base * 2 ** attempt) + random.random()
+
+
+def retry_on_rate_limit(max_attempts: int = 3, base: float = 1.0, cap: float = 30.0):
+    """
+    Retry a provider call with exponential backoff when it is rate limited.
+
+    Works on both regular functions and coroutine functions. Errors that are
+    not rate limits are raised immediately.
+
+    Args:
+        max_attempts: Total number of attempts, including the first
+        base: Delay in seconds before the first retry
+        cap: Maximum delay in seconds between retries
+
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == max_attempts - 1 or not is_rate_limited(e):
+                            raise
+                        delay = _backoff(attempt, base, cap)
+                        logger.warning(
+                            f"{func.__qualname__} rate limited, retrying in {delay:.1f}s "
+                            f"(attempt {attempt + 1}/{max_attempts})"
+                        )
+                        await asyncio.sleep(delay)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts - 1 or not is_rate_limited(e):
+                        raise
+                    delay = _backoff(attempt, base, cap)
+                    logger.warning(
+                        f"{func.__qualname__} rate limited, retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{max_attempts})"
+                    )
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
@@ -1,9 +1,12 @@
 """ElevenLabs Speech-to-Text transcription provider."""
 
+import asyncio
 import os
 import logging
-from io import BytesIO
-from typing import Optional
+import weakref
+from typing import BinaryIO, Optional
+
+from ._retry import rate_limiter, retry_on_rate_limit
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +36,23 @@ class ElevenLabsTranscriber:
             )
 
         self.client = ElevenLabs(api_key=self.api_key)
+        # One async client per event loop: its HTTP connection pool binds to
+        # the loop that first uses it
+        self._async_clients = weakref.WeakKeyDictionary()
         logger.info("Initialized ElevenLabs transcriber")
 
+    @property
+    def async_client(self):
+        """Async client for the running event loop, created on first use in it."""
+        from elevenlabs import AsyncElevenLabs
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncElevenLabs(api_key=self.api_key)
+        return client
+
+    @retry_on_rate_limit()
     def transcribe(
         self,
         audio_path: str,
@@ -57,37 +75,54 @@ class ElevenLabsTranscriber:
         """
         logger.info(f"Transcribing audio file: {audio_path}")
 
-        # Read audio file
-        with open(audio_path, "rb") as audio_file:
-            audio_data = BytesIO(audio_file.read())
+        try:
+            with open(audio_path, "rb") as audio_file:
+                api_params = self._build_params(
+                    audio_path, audio_file, language_code, diarize, tag_audio_events
+                )
+                # Call ElevenLabs Speech-to-Text API
+                result = self.client.speech_to_text.convert(**api_params)
+
+            transcript = self._get_transcript(result)
+            logger.info(f"Transcription completed. Length: {len(transcript)} chars")
+            return transcript
 
-        # Get the filename for the API
-        filename = os.path.basename(audio_path)
+        except Exception as e:
+            logger.error(f"ElevenLabs transcription failed: {e}")
+            raise
 
-        try:
-            # Build API call parameters
-            api_params = {
-                "file": (filename, audio_data),
-                "model_id": "scribe_v1",
-                "diarize": diarize,
-                "tag_audio_events": tag_audio_events,
-            }
-            # Only include language_code if it's a non-empty string
-            if language_code and language_code.strip():
-                api_params["language_code"] = language_code
+    @retry_on_rate_limit()
+    async def atranscribe(
+        self,
+        audio_path: str,
+        language_code: Optional[str] = None,
+        diarize: bool = False,
+        tag_audio_events: bool = False,
+    ) -> str:
+        """
+        Transcribe audio file to text without blocking the event loop.
 
-            # Call ElevenLabs Speech-to-Text API
-            result = self.client.speech_to_text.convert(**api_params)
+        Args:
+            audio_path: Path to the audio file
+            language_code: Optional language code (e.g., "eng", "spa", "por")
+                          If None, auto-detects language
+            diarize: Whether to annotate speaker changes
+            tag_audio_events: Whether to tag audio events like laughter, applause
 
-            # Extract text from result
-            if hasattr(result, "text"):
-                transcript = result.text
-            elif isinstance(result, dict) and "text" in result:
-                transcript = result["text"]
-            else:
-                # Try to get transcript from segments if available
-                transcript = self._extract_text_from_result(result)
+        Returns:
+            Transcribed text
+        """
+        logger.info(f"Transcribing audio file: {audio_path}")
 
+        try:
+            with open(audio_path, "rb") as audio_file:
+                api_params = self._build_params(
+                    audio_path, audio_file, language_code, diarize, tag_audio_events
+                )
+                async with rate_limiter:
+                    result = await self.async_client.speech_to_text.convert(**api_params)
+
+            transcript = self._get_transcript(result)
             logger.info(f"Transcription completed. Length: {len(transcript)} chars")
             return transcript
 
@@ -95,6 +130,64 @@ class ElevenLabsTranscriber:
             logger.error(f"ElevenLabs transcription failed: {e}")
             raise
 
+    def _build_params(
+        self,
+        audio_path: str,
+        audio_file: BinaryIO,
+        language_code: Optional[str],
+        diarize: bool,
+        tag_audio_events: bool,
+    ) -> dict:
+        """
+        Build the Speech-to-Text API parameters.
+
+        The open file is passed through so the SDK streams it rather than
+        holding a second copy of the audio in memory.
+
+        Args:
+            audio_path: Path to the audio file
+            audio_file: The audio file opened in binary mode
+            language_code: Optional language code
+            diarize: Whether to annotate speaker changes
+            tag_audio_events: Whether to tag audio events
+
+        Returns:
+            Keyword arguments for speech_to_text.convert
+        """
+        # Get the filename for the API
+        filename = os.path.basename(audio_path)
+
+        # Build API call parameters
+        api_params = {
+            "file": (filename, audio_file, "audio/mpeg"),
+            "model_id": "scribe_v1",
+            "diarize": diarize,
+            "tag_audio_events": tag_audio_events,
+        }
+        # Only include language_code if it's a non-empty string
+        if language_code and language_code.strip():
+            api_params["language_code"] = language_code
+
+        return api_params
+
+    def _get_transcript(self, result) -> str:
+        """
+        Get the transcript text from an API response.
+
+        Args:
+            result: The API response object
+
+        Returns:
+            Transcribed text
+        """
+        # Extract text from result
+        if hasattr(result, "text"):
+            return result.text
+        if isinstance(result, dict) and "text" in result:
+            return result["text"]
+        # Try to get transcript from segments if available
+        return self._extract_text_from_result(result)
+
     def _extract_text_from_result(self, result) -> str:
         """
         Extract text from various result formats.
@@ -107,19 +200,31 @@ class ElevenLabsTranscriber:
         """
         # If result has segments, join them
         if hasattr(result, "segments"):
-            return " ".join(
-                segment.text for segment in result.segments if hasattr(segment, "text")
-            )
+            return " ".join(self._texts(result.segments))
 
         # If result has words, join them
         if hasattr(result, "words"):
-            return " ".join(
-                word.text for word in result.words if hasattr(word, "text")
-            )
+            return " ".join(self._texts(result.words))
 
         # Try converting to string as fallback
         return str(result)
 
+    def _texts(self, items) -> list:
+        """
+        Collect the text of each word or segment, skipping items without one.
+
+        Args:
+            items: Words or segments from an API response
+
+        Returns:
+            List of text strings
+        """
+        try:
+            # SDK models always carry text, so skip the per-item check
+            return [item.text for item in items]
+        except AttributeError:
+            return [item.text for item in items if hasattr(item, "text")]
+
     def transcribe_with_timestamps(
         self,
         audio_path: str,
@@ -137,24 +242,12 @@ class ElevenLabsTranscriber:
         """
         logger.info(f"Transcribing with timestamps: {audio_path}")
 
-        with open(audio_path, "rb") as audio_file:
-            audio_data = BytesIO(audio_file.read())
-
-        filename = os.path.basename(audio_path)
-
         try:
-            # Build API call parameters
-            api_params = {
-                "file": (filename, audio_data),
-                "model_id": "scribe_v1",
-                "diarize": True,
-                "tag_audio_events": True,
-            }
-            # Only include language_code if it's a non-empty string
-            if language_code and language_code.strip():
-                api_params["language_code"] = language_code
-
-            result = self.client.speech_to_text.convert(**api_params)
+            with open(audio_path, "rb") as audio_file:
+                api_params = self._build_params(
+                    audio_path, audio_file, language_code, diarize=True, tag_audio_events=True
+                )
+                result = self.client.speech_to_text.convert(**api_params)
 
             # Build response with timestamps if available
             response = {
@@ -167,25 +260,38 @@ class ElevenLabsTranscriber:
                 response["text"] = result.text
 
             if hasattr(result, "words"):
-                response["words"] = [
-                    {
-                        "text": w.text if hasattr(w, "text") else str(w),
-                        "start": getattr(w, "start", None),
-                        "end": getattr(w, "end", None),
-                    }
-                    for w in result.words
-                ]
+                try:
+                    # SDK models always carry these fields
+                    response["words"] = [
+                        {"text": w.text, "start": w.start, "end": w.end}
+                        for w in result.words
+                    ]
+                except AttributeError:
+                    response["words"] = [
+                        {
+                            "text": w.text if hasattr(w, "text") else str(w),
+                            "start": getattr(w, "start", None),
+                            "end": getattr(w, "end", None),
+                        }
+                        for w in result.words
+                    ]
 
             if hasattr(result, "segments"):
-                response["segments"] = [
-                    {
-                        "text": s.text if hasattr(s, "text") else str(s),
-                        "start": getattr(s, "start", None),
-                        "end": getattr(s, "end", None),
-                        "speaker": getattr(s, "speaker", None),
-                    }
-                    for s in result.segments
-                ]
+                try:
+                    response["segments"] = [
+                        {"text": s.text, "start": s.start, "end": s.end, "speaker": s.speaker}
+                        for s in result.segments
+                    ]
+                except AttributeError:
+                    response["segments"] = [
+                        {
+                            "text": s.text if hasattr(s, "text") else str(s),
+                            "start": getattr(s, "start", None),
+                            "end": getattr(s, "end", None),
+                            "speaker": getattr(s, "speaker", None),
+                        }
+                        for s in result.segments
+                    ]
 
             return response
 
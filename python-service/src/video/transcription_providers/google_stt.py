@@ -1,16 +1,34 @@
 """Google Cloud Speech-to-Text transcription provider."""
 
+import asyncio
 import logging
 import os
-from pathlib import Path
+import threading
+import weakref
+from typing import ClassVar, Dict, Tuple
 from google.cloud import speech_v1 as speech
 
+from ._retry import rate_limiter, retry_on_rate_limit
+
 logger = logging.getLogger(__name__)
 
+# Largest local file the API accepts inline; longer audio is split into
+# chunks by Transcriber before it gets here
+_INLINE_LIMIT = 10 * 1024 * 1024  # 10MB
+
 
 class GoogleSTTTranscriber:
     """Google Cloud Speech-to-Text transcription provider."""
 
+    # Clients keyed by credentials path, shared so the channel and OAuth
+    # setup happen once per process instead of once per transcriber. Async
+    # clients are also keyed by event loop, since their channel binds to it.
+    _CLIENTS: ClassVar[Dict[str, speech.SpeechClient]] = {}
+    _ASYNC_CLIENTS: ClassVar[
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, speech.SpeechAsyncClient]]"
+    ] = weakref.WeakKeyDictionary()
+    _CLIENTS_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, credentials_path: str = None):
         """
         Initialize the Google STT transcriber.
@@ -21,14 +39,39 @@ class GoogleSTTTranscriber:
         if credentials_path:
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
 
-        self.client = speech.SpeechClient()
+        self._client_key = credentials_path or ""
+        with self._CLIENTS_LOCK:
+            client = self._CLIENTS.get(self._client_key)
+            if client is None:
+                client = speech.SpeechClient()
+                self._CLIENTS[self._client_key] = client
+        self.client = client
 
+    @property
+    def async_client(self) -> speech.SpeechAsyncClient:
+        """
+        Shared async client for these credentials and the running event loop.
+
+        Created on first use in each loop because its gRPC channel binds to
+        the loop it was created on.
+        """
+        loop = asyncio.get_running_loop()
+        with self._CLIENTS_LOCK:
+            clients = self._ASYNC_CLIENTS.setdefault(loop, {})
+            client = clients.get(self._client_key)
+            if client is None:
+                client = speech.SpeechAsyncClient()
+                clients[self._client_key] = client
+        return client
+
+    @retry_on_rate_limit()
     def transcribe(self, audio_path: str, language_code: str = "en-US") -> str:
         """
         Transcribe an audio file.
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or a gs:// URI for audio in
+                        Cloud Storage
             language_code: Language code (default: en-US)
 
         Returns:
@@ -38,40 +81,114 @@ class GoogleSTTTranscriber:
             Exception: If transcription fails
         """
         try:
-            # Read the audio file
-            with open(audio_path, 'rb') as audio_file:
-                content = audio_file.read()
-
-            audio = speech.RecognitionAudio(content=content)
-
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.MP3,
-                sample_rate_hertz=16000,
-                language_code=language_code,
-                enable_automatic_punctuation=True,
-                model='default',
-            )
+            config, audio = self._build_request(audio_path, language_code)
 
-            # For files larger than 1 minute, use long_running_recognize
-            file_size = Path(audio_path).stat().st_size
-            if file_size > 10 * 1024 * 1024:  # 10MB threshold
-                logger.info("Using long-running recognition for large file")
+            if audio.uri:
+                logger.info("Using long-running recognition for Cloud Storage audio")
                 operation = self.client.long_running_recognize(config=config, audio=audio)
                 response = operation.result(timeout=300)
             else:
                 response = self.client.recognize(config=config, audio=audio)
 
-            # Combine all transcripts
-            transcript_parts = []
-            for result in response.results:
-                if result.alternatives:
-                    transcript_parts.append(result.alternatives[0].transcript)
+            return self._join_results(response.results)
 
-            transcript = ' '.join(transcript_parts)
-            logger.info(f"Transcribed {len(transcript)} characters")
+        except Exception as e:
+            logger.error(f"Failed to transcribe audio {audio_path}: {e}")
+            raise
 
-            return transcript
+    @retry_on_rate_limit()
+    async def atranscribe(self, audio_path: str, language_code: str = "en-US") -> str:
+        """
+        Transcribe an audio file without blocking the event loop.
+
+        Args:
+            audio_path: Path to the audio file, or a gs:// URI for audio in
+                        Cloud Storage
+            language_code: Language code (default: en-US)
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            Exception: If transcription fails
+        """
+        try:
+            config, audio = await asyncio.to_thread(
+                self._build_request, audio_path, language_code
+            )
+
+            async with rate_limiter:
+                if audio.uri:
+                    logger.info("Using long-running recognition for Cloud Storage audio")
+                    operation = await self.async_client.long_running_recognize(
+                        config=config, audio=audio
+                    )
+                    response = await operation.result(timeout=300)
+                else:
+                    response = await self.async_client.recognize(config=config, audio=audio)
+
+            return self._join_results(response.results)
 
         except Exception as e:
             logger.error(f"Failed to transcribe audio {audio_path}: {e}")
             raise
+
+    def _build_request(
+        self, audio_path: str, language_code: str
+    ) -> Tuple[speech.RecognitionConfig, speech.RecognitionAudio]:
+        """
+        Build the recognition config and audio for a file.
+
+        Args:
+            audio_path: Path to the audio file, or a gs:// URI
+            language_code: Language code
+
+        Returns:
+            Tuple of (config, audio)
+
+        Raises:
+            ValueError: If a local file is too large to send inline
+        """
+        if audio_path.startswith('gs://'):
+            # Let the API read from Cloud Storage instead of sending the bytes
+            audio = speech.RecognitionAudio(uri=audio_path)
+        elif os.path.getsize(audio_path) > _INLINE_LIMIT:
+            raise ValueError(
+                f"{audio_path} is over the 10MB inline limit; transcribe it through "
+                f"Transcriber, which splits long audio, or upload it to Cloud Storage"
+            )
+        else:
+            # Read the audio file
+            with open(audio_path, 'rb') as audio_file:
+                audio = speech.RecognitionAudio(content=audio_file.read())
+
+        config = speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.MP3,
+            sample_rate_hertz=16000,
+            language_code=language_code,
+            enable_automatic_punctuation=True,
+            model='default',
+        )
+
+        return config, audio
+
+    def _join_results(self, results) -> str:
+        """
+        Combine the top alternative of every final result into one transcript.
+
+        Args:
+            results: Results from a recognize or long-running response
+
+        Returns:
+            Transcribed text
+        """
+        # Combine all transcripts
+        transcript_parts = []
+        for result in results:
+            if result.alternatives:
+                transcript_parts.append(result.alternatives[0].transcript)
+
+        transcript = ' '.join(transcript_parts)
+        logger.info(f"Transcribed {len(transcript)} characters")
+
+        return transcript
@@ -1,14 +1,81 @@
 """Whisper transcription provider (alternative to Google STT)."""
 
+import asyncio
 import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from ._retry import rate_limiter, retry_on_rate_limit
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 logger = logging.getLogger(__name__)
 
+# Loaded local models shared by all transcriber instances,
+# keyed by (model_name, device, device_index, compute_type)
+_MODEL_CACHE: Dict[Tuple[str, str, int, str], "WhisperModel"] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _load_model(
+    model_name: str,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    device_index: int = 0,
+) -> "WhisperModel":
+    """
+    Load a local faster-whisper model, reusing one already loaded with the same settings.
+
+    Args:
+        model_name: Whisper model name
+        device: "cuda" or "cpu" (default: CUDA if a GPU is visible)
+        compute_type: CTranslate2 compute type (default: int8_float16 on CUDA, int8 on CPU)
+        device_index: GPU to load the model on, for multi-GPU hosts
+
+    Returns:
+        Loaded WhisperModel
+    """
+    from faster_whisper import WhisperModel
+
+    if device is None:
+        import ctranslate2
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type is None:
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+    elif device == "cpu" and "float16" in compute_type:
+        # Half precision needs a GPU; CPU-only hosts get the int8 kernels instead
+        logger.warning(f"compute_type {compute_type} is not supported on CPU, using int8")
+        compute_type = "int8"
+
+    key = (model_name, device, device_index, compute_type)
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            model = WhisperModel(
+                model_name,
+                device=device,
+                device_index=device_index,
+                compute_type=compute_type,
+            )
+            _MODEL_CACHE[key] = model
+            logger.info(f"Loaded Whisper model: {model_name} ({device}, {compute_type})")
+        return model
+
 
 class WhisperTranscriber:
     """Whisper transcription provider (local or API)."""
 
-    def __init__(self, model_name: str = "base", use_api: bool = False, api_key: str = None):
+    def __init__(
+        self,
+        model_name: str = "base",
+        use_api: bool = False,
+        api_key: str = None,
+        device: str = None,
+        compute_type: str = None,
+        device_index: int = 0,
+    ):
         """
         Initialize the Whisper transcriber.
 
@@ -16,6 +83,10 @@ class WhisperTranscriber:
             model_name: Whisper model name (tiny, base, small, medium, large)
             use_api: Whether to use OpenAI's Whisper API
             api_key: OpenAI API key (required if use_api=True)
+            device: Device for the local model, "cuda" or "cpu" (default: CUDA if available)
+            compute_type: Quantization for the local model (default: int8_float16 on
+                          CUDA, int8 on CPU); float16 runs the model in half precision
+            device_index: GPU to load the local model on, for multi-GPU hosts
         """
         self.use_api = use_api
         self.model_name = model_name
@@ -24,19 +95,32 @@ class WhisperTranscriber:
             if not api_key:
                 raise ValueError("API key required for Whisper API")
             import openai
+            self.api_key = api_key
             self.client = openai.OpenAI(api_key=api_key)
+            # One async client per event loop: its HTTP connection pool binds
+            # to the loop that first uses it
+            self._async_clients = weakref.WeakKeyDictionary()
         else:
             # Local Whisper model
             try:
-                import whisper
-                self.model = whisper.load_model(model_name)
-                logger.info(f"Loaded Whisper model: {model_name}")
+                self.model = _load_model(model_name, device, compute_type, device_index)
             except ImportError:
                 raise ImportError(
-                    "openai-whisper package not installed. "
-                    "Install with: pip install openai-whisper"
+                    "faster-whisper package not installed. "
+                    "Install with: pip install faster-whisper"
                 )
 
+    @property
+    def async_client(self):
+        """Async OpenAI client for the running event loop, created on first use in it."""
+        import openai
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = openai.AsyncOpenAI(api_key=self.api_key)
+        return client
+
     def transcribe(self, audio_path: str, language: str = None) -> str:
         """
         Transcribe an audio file.
@@ -61,6 +145,33 @@ class WhisperTranscriber:
             logger.error(f"Failed to transcribe audio {audio_path}: {e}")
             raise
 
+    async def atranscribe(self, audio_path: str, language: str = None) -> str:
+        """
+        Transcribe an audio file without blocking the event loop.
+
+        The local model runs in a worker thread.
+
+        Args:
+            audio_path: Path to the audio file
+            language: Language code (optional, e.g., 'en')
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            Exception: If transcription fails
+        """
+        try:
+            if self.use_api:
+                return await self._atranscribe_api(audio_path)
+            else:
+                return await asyncio.to_thread(self._transcribe_local, audio_path, language)
+
+        except Exception as e:
+            logger.error(f"Failed to transcribe audio {audio_path}: {e}")
+            raise
+
+    @retry_on_rate_limit()
     def _transcribe_api(self, audio_path: str) -> str:
         """Transcribe using OpenAI Whisper API."""
         with open(audio_path, 'rb') as audio_file:
@@ -71,11 +182,25 @@ class WhisperTranscriber:
             )
         return transcript
 
+    @retry_on_rate_limit()
+    async def _atranscribe_api(self, audio_path: str) -> str:
+        """Transcribe using OpenAI Whisper API with the async client."""
+        with open(audio_path, 'rb') as audio_file:
+            async with rate_limiter:
+                transcript = await self.async_client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=audio_file,
+                    response_format="text"
+                )
+        return transcript
+
     def _transcribe_local(self, audio_path: str, language: str = None) -> str:
         """Transcribe using local Whisper model."""
-        options = {}
-        if language:
-            options['language'] = language
-
-        result = self.model.transcribe(audio_path, **options)
-        return result['text']
+        # Greedy decoding; VAD drops silent stretches before decoding
+        segments, _ = self.model.transcribe(
+            audio_path,
+            language=language or None,
+            beam_size=1,
+            vad_filter=True,
+        )
+        return " ".join(segment.text.strip() for segment in segments)
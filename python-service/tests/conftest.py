@@ -0,0 +1,36 @@
+"""Shared test fixtures."""
+
+import math
+
+import av
+import pytest
+
+
+def write_tone(path, seconds: float, rate: int = 16000) -> None:
+    """Write a 16kHz mono MP3 sine tone of the given length."""
+    samples = int(seconds * rate)
+    frame_size = 1152
+    with av.open(str(path), mode='w', format='mp3') as output:
+        stream = output.add_stream('libmp3lame', rate=rate, layout='mono')
+        for start in range(0, samples, frame_size):
+            count = min(frame_size, samples - start)
+            frame = av.AudioFrame(format='s16p', layout='mono', samples=count)
+            frame.planes[0].update(
+                b''.join(
+                    int(8000 * math.sin(2 * math.pi * 440 * (start + i) / rate)).to_bytes(
+                        2, 'little', signed=True
+                    )
+                    for i in range(count)
+                )
+            )
+            frame.sample_rate = rate
+            frame.pts = start
+            output.mux(stream.encode(frame))
+        output.mux(stream.encode(None))
+
+
+@pytest.fixture
+def tone(tmp_path):
+    path = tmp_path / "tone.mp3"
+    write_tone(path, 5.0)
+    return str(path)
@@ -0,0 +1,28 @@
+"""Tests for splitting audio into overlapping chunks."""
+
+import pytest
+
+from src.video.audio_extractor import AudioExtractor
+
+
+def test_chunk_audio_splits_into_overlapping_chunks(tone, tmp_path):
+    out_dir = tmp_path / "chunks"
+    out_dir.mkdir()
+
+    paths = AudioExtractor.chunk_audio(tone, str(out_dir), chunk_s=2.0, overlap_s=0.5)
+
+    assert [p.rsplit('/', 1)[1] for p in paths] == [
+        "tone_0000.mp3", "tone_0001.mp3", "tone_0002.mp3"
+    ]
+    durations = [AudioExtractor.get_audio_duration(p) for p in paths]
+    # Every chunk but the last runs overlap_s past the next chunk's start
+    assert durations[0] == pytest.approx(2.5, abs=0.1)
+    assert durations[1] == pytest.approx(2.5, abs=0.1)
+    assert durations[2] == pytest.approx(1.0, abs=0.1)
+
+
+def test_chunk_audio_keeps_short_audio_in_one_chunk(tone, tmp_path):
+    paths = AudioExtractor.chunk_audio(tone, str(tmp_path), chunk_s=10.0, overlap_s=1.0)
+
+    assert len(paths) == 1
+    assert AudioExtractor.get_audio_duration(paths[0]) == pytest.approx(5.0, abs=0.1)
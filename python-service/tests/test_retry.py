@@ -0,0 +1,83 @@
+"""Tests for rate-limit detection and retries."""
+
+import pytest
+
+from src.video.transcription_providers import _retry
+from src.video.transcription_providers._retry import is_rate_limited, retry_on_rate_limit
+
+
+class StatusError(Exception):
+    def __init__(self, message: str = "", status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(_retry, "_backoff", lambda attempt, base, cap: 0)
+
+
+@pytest.mark.parametrize("error", [
+    StatusError(status_code=429),
+    Exception("429 Too Many Requests"),
+    Exception("Resource exhausted: quota exceeded"),
+    Exception("rate_limit_exceeded"),
+])
+def test_is_rate_limited_detects_rate_limits(error):
+    assert is_rate_limited(error)
+
+
+@pytest.mark.parametrize("error", [
+    StatusError(status_code=500),
+    ValueError("invalid audio"),
+])
+def test_is_rate_limited_ignores_other_errors(error):
+    assert not is_rate_limited(error)
+
+
+def _flaky(failures):
+    """Function that raises each of failures in turn, then returns 'ok'."""
+    calls = []
+
+    def func():
+        calls.append(None)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return "ok"
+
+    return func, calls
+
+
+def test_retry_recovers_from_rate_limits():
+    func, calls = _flaky([StatusError(status_code=429)] * 2)
+
+    assert retry_on_rate_limit(max_attempts=3)(func)() == "ok"
+    assert len(calls) == 3
+
+
+def test_retry_gives_up_after_max_attempts():
+    func, calls = _flaky([StatusError(status_code=429)] * 3)
+
+    with pytest.raises(StatusError):
+        retry_on_rate_limit(max_attempts=3)(func)()
+    assert len(calls) == 3
+
+
+def test_retry_raises_other_errors_immediately():
+    func, calls = _flaky([ValueError("invalid audio")])
+
+    with pytest.raises(ValueError):
+        retry_on_rate_limit(max_attempts=3)(func)()
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_wraps_coroutine_functions():
+    func, calls = _flaky([Exception("rate limit exceeded")])
+
+    @retry_on_rate_limit(max_attempts=3)
+    async def transcribe():
+        return func()
+
+    assert await transcribe() == "ok"
+    assert len(calls) == 2
@@ -0,0 +1,98 @@
+"""Tests for streaming scrapes and collecting them into one result."""
+
+import pytest
+
+from src.scrapers.base import ScrapeResult
+from src.scrapers.youtube import YouTubeScraper
+
+
+class FakeDownloader:
+    def download(self, url, platform=None):
+        return {
+            'video_path': '/nonexistent/video.mp4',
+            'title': 'Pancakes',
+            'description': 'Fluffy pancakes',
+            'author': 'chef',
+            'duration': 300,
+        }
+
+
+class FakeAudioExtractor:
+    @staticmethod
+    def extract_audio(video_path):
+        return '/nonexistent/video.mp3'
+
+
+class FakeTranscriber:
+    """Yields the given pieces, raising fail_with after them if set."""
+
+    def __init__(self, pieces, fail_with=None):
+        self.pieces = pieces
+        self.fail_with = fail_with
+
+    async def atranscribe_stream(self, audio_path, language=None):
+        for piece in self.pieces:
+            yield piece
+        if self.fail_with is not None:
+            raise self.fail_with
+
+
+def _scraper(transcriber):
+    scraper = YouTubeScraper.__new__(YouTubeScraper)
+    scraper.downloader = FakeDownloader()
+    scraper.audio_extractor = FakeAudioExtractor()
+    scraper.transcriber = transcriber
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_scrape_stream_yields_header_then_transcript_pieces():
+    scraper = _scraper(FakeTranscriber(["mix the batter", " and fry"]))
+
+    items = [item async for item in scraper.scrape_stream("https://youtu.be/x")]
+
+    assert isinstance(items[0], ScrapeResult)
+    assert items[0].captions == "Fluffy pancakes"
+    assert items[0].transcript is None
+    assert items[1:] == ["mix the batter", " and fry"]
+
+
+@pytest.mark.asyncio
+async def test_scrape_joins_the_streamed_transcript():
+    scraper = _scraper(FakeTranscriber(["mix the batter", " and fry"]))
+
+    result = await scraper.scrape("https://youtu.be/x")
+
+    assert result.transcript == "mix the batter and fry"
+    assert result.error is None
+
+
+@pytest.mark.asyncio
+async def test_scrape_stream_fails_when_transcription_fails_partway():
+    scraper = _scraper(FakeTranscriber(["mix the batter"], fail_with=RuntimeError("chunk 2")))
+
+    items = []
+    with pytest.raises(RuntimeError):
+        async for item in scraper.scrape_stream("https://youtu.be/x"):
+            items.append(item)
+    assert items[1:] == ["mix the batter"]
+
+
+@pytest.mark.asyncio
+async def test_scrape_drops_a_transcript_that_failed_partway():
+    scraper = _scraper(FakeTranscriber(["mix the batter"], fail_with=RuntimeError("chunk 2")))
+
+    result = await scraper.scrape("https://youtu.be/x")
+
+    assert result.transcript == ""
+    assert result.captions == "Fluffy pancakes"
+
+
+@pytest.mark.asyncio
+async def test_scrape_continues_without_transcript_when_transcription_fails_upfront():
+    scraper = _scraper(FakeTranscriber([], fail_with=RuntimeError("provider down")))
+
+    items = [item async for item in scraper.scrape_stream("https://youtu.be/x")]
+
+    assert len(items) == 1
+    assert items[0].error is None
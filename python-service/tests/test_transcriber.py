@@ -0,0 +1,95 @@
+"""Tests for chunked transcription and joining chunk transcripts."""
+
+import pytest
+
+from src.video import transcriber as transcriber_module
+from src.video.transcriber import Transcriber, _merge_overlapping
+
+
+class FakeProvider:
+    """Records the files it is sent and returns one word per file."""
+
+    def __init__(self):
+        self.paths = []
+
+    def transcribe(self, audio_path, language=None):
+        self.paths.append(audio_path)
+        return f"part{len(self.paths)}"
+
+    async def atranscribe(self, audio_path, language=None):
+        return self.transcribe(audio_path, language)
+
+
+@pytest.fixture
+def short_chunks(monkeypatch):
+    """Split anything over 2.5s into 2s chunks with a 0.5s overlap."""
+    monkeypatch.setattr(transcriber_module, "_CHUNK_S", 2.0)
+    monkeypatch.setattr(transcriber_module, "_CHUNK_OVERLAP_S", 0.5)
+
+
+@pytest.fixture
+def transcriber(short_chunks):
+    transcriber = Transcriber("elevenlabs", api_key="test")
+    transcriber.transcriber = FakeProvider()
+    transcriber._chunk_threshold_s = 2.5
+    return transcriber
+
+
+def test_transcribe_splits_long_files(transcriber, tone):
+    assert transcriber.transcribe(tone) == "part1 part2 part3"
+    assert all(path != tone for path in transcriber.transcriber.paths)
+
+
+def test_transcribe_sends_short_files_whole(transcriber, tone):
+    transcriber._chunk_threshold_s = 10.0
+
+    assert transcriber.transcribe(tone) == "part1"
+    assert transcriber.transcriber.paths == [tone]
+
+
+@pytest.mark.asyncio
+async def test_atranscribe_splits_long_files(transcriber, tone):
+    assert await transcriber.atranscribe(tone) == "part1 part2 part3"
+
+
+def test_merge_drops_words_repeated_across_the_overlap():
+    texts = [
+        "add the flour and mix well",
+        "mix well then bake for twenty minutes",
+    ]
+
+    assert _merge_overlapping(texts) == "add the flour and mix well then bake for twenty minutes"
+
+
+def test_merge_keeps_chunks_without_an_overlap():
+    texts = ["preheat the oven", "grease the pan"]
+
+    assert _merge_overlapping(texts) == "preheat the oven grease the pan"
+
+
+def test_merge_ignores_a_single_repeated_word():
+    # One shared word is too weak a signal to treat as overlap
+    texts = ["stir the sauce", "sauce thickens"]
+
+    assert _merge_overlapping(texts) == "stir the sauce sauce thickens"
+
+
+def test_merge_ignores_repeats_far_from_the_boundary():
+    texts = [
+        "mix well and then leave it",
+        "to rest for an hour before you mix well",
+    ]
+
+    assert _merge_overlapping(texts) == (
+        "mix well and then leave it to rest for an hour before you mix well"
+    )
+
+
+def test_merge_skips_empty_chunks():
+    texts = ["", "chop the onions", "", "onions until golden"]
+
+    assert _merge_overlapping(texts) == "chop the onions onions until golden"
+
+
+def test_merge_of_no_chunks_is_empty():
+    assert _merge_overlapping([]) == ""
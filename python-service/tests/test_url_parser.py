@@ -0,0 +1,37 @@
+"""Tests for URL normalization."""
+
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+from src.utils.url_parser import is_valid_url, normalize_url
+
+
+def _urlparse_normalized(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=abc123&t=10s",
+    "https://www.tiktok.com/@chef/video/123#comments",
+    "https://www.instagram.com/reel/Cabc_-1/?igsh=xyz",
+    "HTTPS://Example.com/Recipes/Pancakes/",
+    "https://example.com",
+    "http://a.com/p;x?q",
+    "http://a.com/p;x/q;y;z#f",
+    "http://a.com/;x",
+    "http://a.com;x/y",
+])
+def test_normalize_url_matches_urlparse(url):
+    assert normalize_url(url) == _urlparse_normalized(url)
+
+
+def test_normalize_url_is_linear_on_many_semicolons():
+    url = "http://a/" + ";" * 100_000 + "/x;y"
+
+    start = time.perf_counter()
+    assert normalize_url(url) == _urlparse_normalized(url)
+    assert is_valid_url(url)
+    assert time.perf_counter() - start < 1.0
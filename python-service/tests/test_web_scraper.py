@@ -0,0 +1,81 @@
+"""Tests for WebScraper's page cache."""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from src.scrapers import web as web_module
+from src.scrapers.web import WebScraper
+from src.utils.http import close_session
+
+PAGE = b"<html><head><title>Pancakes</title></head><body><p>Mix and fry.</p></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    web_module._PAGE_CACHE.clear()
+    yield
+    web_module._PAGE_CACHE.clear()
+
+
+@pytest_asyncio.fixture
+async def site():
+    """Local site whose pages can be given an ETag; records each request's If-None-Match."""
+    state = {"etag": '"v1"', "requests": []}
+
+    async def page(request):
+        if_none_match = request.headers.get("If-None-Match")
+        state["requests"].append(if_none_match)
+        if state["etag"] and if_none_match == state["etag"]:
+            return web.Response(status=304)
+        headers = {"ETag": state["etag"]} if state["etag"] else {}
+        return web.Response(body=PAGE, content_type="text/html", headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/recipe", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    server = web.TCPSite(runner, "127.0.0.1", 0)
+    await server.start()
+    port = runner.addresses[0][1]
+    state["url"] = f"http://127.0.0.1:{port}/recipe"
+    yield state
+    await close_session()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_page_reuses_the_cached_result(site):
+    scraper = WebScraper()
+
+    first = await scraper.scrape(site["url"])
+    second = await scraper.scrape(site["url"])
+
+    assert first.metadata["title"] == "Pancakes"
+    assert second is first
+    assert site["requests"] == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_changed_page_is_parsed_again(site):
+    scraper = WebScraper()
+
+    first = await scraper.scrape(site["url"])
+    site["etag"] = '"v2"'
+    second = await scraper.scrape(site["url"])
+
+    assert second is not first
+    assert second.metadata == first.metadata
+    assert web_module._PAGE_CACHE[site["url"]][1] == '"v2"'
+
+
+@pytest.mark.asyncio
+async def test_page_without_etag_is_served_from_cache(site):
+    site["etag"] = None
+    scraper = WebScraper()
+
+    first = await scraper.scrape(site["url"])
+    second = await scraper.scrape(site["url"])
+
+    assert second is first
+    assert site["requests"] == [None]